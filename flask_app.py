@@ -3,20 +3,42 @@ VieNeu-TTS Flask App — Simple TTS web interface with polling.
 
 Run:  uv run --with flask flask_app.py
 Open: http://127.0.0.1:5000
+
+For production, install gunicorn (Linux/macOS) and the app will serve itself
+under a threaded gunicorn worker, which honors kernel sendfile() for WAV
+downloads instead of copying file bytes through Python. Set FLASK_DEV=1 to
+force the Werkzeug dev server.
 """
 
+import io
 import os
 import sys
+import gzip
+import json
 import uuid
+import struct
+import hashlib
 import tempfile
 import threading
 import time
 import queue
+import shutil
 import subprocess
 import logging
 import socket
+import inspect
 import yaml
 import requests
+# Hot-path third-party imports live at module level: function-local imports
+# are cached in sys.modules after the first call, but each one still takes
+# the import machinery's module lock, which serializes request threads.
+# torch and the vieneu SDK stay lazy — they are heavyweight and only needed
+# once model loading starts, so the HTTP port opens without them.
+import numpy as np
+import soundfile as sf
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 logging.basicConfig(
@@ -25,10 +47,91 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S",
 )
 
-from flask import Flask, request, jsonify, send_file, render_template, Response
+from flask import Flask, request, jsonify, send_file, Response
+
+from vieneu_utils.core_utils import env_bool, split_text_into_chunks
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 app = Flask(__name__)
 
+# When fronted by nginx/apache, X-Sendfile hands WAV transmission to the
+# proxy entirely (zero-copy in the proxy, worker thread freed immediately).
+# Opt-in because it requires matching proxy configuration.
+app.config["USE_X_SENDFILE"] = env_bool("USE_X_SENDFILE")
+
+# Reject oversized uploads before the body is read: a 3-5 s reference clip
+# is well under a megabyte even at 48 kHz, so anything beyond this is a
+# mistake (or abuse) not worth hashing and spooling to disk.
+app.config["MAX_CONTENT_LENGTH"] = int(
+    os.environ.get("VIENEU_MAX_UPLOAD_BYTES", str(50 * 1024 * 1024)))
+
+if orjson is not None:
+    from flask.json.provider import JSONProvider
+
+    class _OrjsonProvider(JSONProvider):
+        """Serialize jsonify responses with orjson (~3-10x faster than
+        stdlib json on the small dicts returned by the hot endpoints)."""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = _OrjsonProvider(app)
+
+
+def _json_dumps(obj):
+    """orjson-backed dumps for non-jsonify payloads (SSE frames)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+# Below this size compression costs more than the bytes it saves
+_COMPRESS_MIN_BYTES = 500
+
+
+@app.after_request
+def compress_json(response):
+    """Compress JSON responses with Brotli (or gzip) when the client accepts it.
+
+    Audio and streaming responses are left alone: WAV/WebM is already
+    encoded (and compressing would break sendfile passthrough), and SSE
+    must flush incrementally.
+    """
+    if (response.direct_passthrough
+            or response.mimetype != "application/json"
+            or response.content_length is None
+            or response.content_length < _COMPRESS_MIN_BYTES
+            or "Content-Encoding" in response.headers):
+        return response
+    accept = request.headers.get("Accept-Encoding", "")
+    if brotli is not None and "br" in accept:
+        response.set_data(brotli.compress(response.get_data(), quality=4))
+        response.headers["Content-Encoding"] = "br"
+    elif "gzip" in accept:
+        response.set_data(gzip.compress(response.get_data(), compresslevel=6))
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        return response
+    response.headers["Vary"] = "Accept-Encoding"
+    return response
+
+
 @app.after_request
 def add_cors(response):
     response.headers["Access-Control-Allow-Origin"] = "*"
@@ -52,28 +155,227 @@ tts = None
 model_loaded = False
 current_backbone = None
 current_codec = None
-
-# In-memory job store: {job_id: {status, progress, audio_path, error, ...}}
+# Set once the startup preload finishes (or a model is loaded on demand);
+# /api/health reports it so the UI can open before the weights are in.
+model_ready = threading.Event()
+
+class Job:
+    """In-memory record for one synthesis job.
+
+    __slots__ keeps per-job memory to a fixed layout and turns attribute
+    access into an offset load instead of a per-lookup dict probe — the
+    worker and stream threads touch these fields on every chunk.
+    """
+
+    __slots__ = ("status", "progress", "audio_path", "error",
+                 "chunks_total", "chunks_done", "cancelled",
+                 "pcm_history", "pcm_listeners", "pcm_done",
+                 "listeners", "ffmpeg_proc", "etag",
+                 "created_at", "completed_at", "audio_bytes", "opus_path",
+                 "pcm_lock")
+
+    def __init__(self):
+        self.status = "pending"
+        self.progress = "Queued"
+        self.audio_path = None
+        self.error = None
+        self.chunks_total = 0
+        self.chunks_done = 0
+        self.cancelled = False
+        self.pcm_history = []      # published PCM chunks (replay buffer)
+        self.pcm_listeners = []    # _PcmListener per active stream
+        self.pcm_done = False
+        self.listeners = []        # SSE status queues
+        self.ffmpeg_proc = None
+        self.etag = None           # set once the final WAV is written
+        self.created_at = time.monotonic()
+        self.completed_at = None   # set when status becomes done/error
+        self.audio_bytes = None    # small finished WAVs cached in memory
+        self.opus_path = None      # 32 kbps Opus rendition, encoded async
+        self.pcm_lock = threading.Lock()  # orders history vs. subscribers
+
+
+# In-memory job store: {job_id: Job}
 jobs = {}
 
+# Finished job records are swept after a TTL: each one pins its PCM replay
+# history in RAM, so a long-running server would otherwise creep upward in
+# memory and the jobs dict would grow without bound. Only done/error jobs
+# are reaped — queued work still references its record — and the WAV on
+# disk is the user's saved history, so it is left alone.
+_JOB_TTL_SECONDS = int(os.environ.get("VIENEU_JOB_TTL", "1800"))
+
+# WAVs below this size are mirrored into the job record when finished so
+# re-downloads are served from memory (see get_audio).
+_AUDIO_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+
+def _sweep_jobs():
+    while True:
+        time.sleep(60)
+        now = time.monotonic()
+        for job_id, job in list(jobs.items()):
+            if job.status not in ("done", "error"):
+                continue
+            done_at = job.completed_at or job.created_at
+            if now - done_at > _JOB_TTL_SECONDS:
+                jobs.pop(job_id, None)
+        _sweep_disk_cache()
+
+
 # Base directory for saving user audio outputs
 OUTPUTS_DIR = Path(__file__).parent / "outputs"
 OUTPUTS_DIR.mkdir(exist_ok=True)
 
+# Content-addressed synthesis cache: <sha256-of-request>.wav. Entries are
+# hard links into users' history files where possible, so the cache costs
+# little extra disk. The sweeper LRU-evicts it down to a byte budget so
+# distinct requests cannot grow it without bound.
+CACHE_DIR = Path(__file__).parent / "cache"
+CACHE_DIR.mkdir(exist_ok=True)
+_DISK_CACHE_MAX_BYTES = int(os.environ.get("VIENEU_DISK_CACHE_MAX_BYTES",
+                                           str(2 * 1024 * 1024 * 1024)))
+
+
+def _sweep_disk_cache():
+    """LRU-evict cache/ down to _DISK_CACHE_MAX_BYTES.
+
+    Each entry is a WAV plus an optional Opus sibling, evicted together,
+    least-recently-read first (st_atime, with st_mtime as the floor for
+    noatime mounts). Hard-linked history copies in outputs/ are unaffected
+    — unlinking the cache name only drops the cache's reference. A job
+    still pointing at an evicted .opus falls back to its WAV via the
+    existence check in the route.
+    """
+    entries = []
+    total = 0
+    for wav in CACHE_DIR.glob("*.wav"):
+        try:
+            st = wav.stat()
+        except OSError:
+            continue
+        size = st.st_size
+        opus = wav.with_suffix(".opus")
+        try:
+            size += opus.stat().st_size
+        except OSError:
+            opus = None
+        entries.append((max(st.st_atime, st.st_mtime), size, wav, opus))
+        total += size
+    if total <= _DISK_CACHE_MAX_BYTES:
+        return
+    entries.sort(key=lambda e: e[0])
+    for _used, size, wav, opus in entries:
+        for path in (wav, opus):
+            if path is not None:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+        total -= size
+        if total <= _DISK_CACHE_MAX_BYTES:
+            break
+
+# Pre-rendered preset-voice previews; generated once after the model
+# preload so auditioning voices is a static file serve, not a synthesis.
+PREVIEWS_DIR = Path(__file__).parent / "previews"
+PREVIEWS_DIR.mkdir(exist_ok=True)
+PREVIEW_TEXT = "Xin chào, đây là giọng đọc thử của tôi."
+
+
+def _preview_path(voice_id):
+    return PREVIEWS_DIR / f"{_safe_username(voice_id)}.wav"
+
+# In-memory tier in front of the disk cache: raw WAV bytes for recently
+# served synth keys, so UI preview churn (clicking through voices) hits
+# neither the model nor the disk. Byte-budgeted LRU; tunable/disableable
+# via env.
+_MEM_CACHE_ENABLED = env_bool("VIENEU_MEM_CACHE", True)
+_MEM_CACHE_MAX_BYTES = int(os.environ.get("VIENEU_MEM_CACHE_MAX_BYTES",
+                                          str(100 * 1024 * 1024)))
+_mem_cache = OrderedDict()
+_mem_cache_bytes = 0
+_mem_cache_lock = threading.Lock()
+
+# In-flight coalescing: synth_key -> job_id of the pending/processing job
+# for that key, so identical concurrent requests share one synthesis. The
+# worker removes its entry when the job leaves the in-flight states.
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def _mem_cache_get(key):
+    if not _MEM_CACHE_ENABLED:
+        return None
+    with _mem_cache_lock:
+        data = _mem_cache.get(key)
+        if data is not None:
+            _mem_cache.move_to_end(key)
+        return data
+
+
+def _mem_cache_put(key, data):
+    global _mem_cache_bytes
+    if not _MEM_CACHE_ENABLED or len(data) > _MEM_CACHE_MAX_BYTES:
+        return
+    with _mem_cache_lock:
+        if key in _mem_cache:
+            return
+        _mem_cache[key] = data
+        _mem_cache_bytes += len(data)
+        while _mem_cache_bytes > _MEM_CACHE_MAX_BYTES:
+            _, evicted = _mem_cache.popitem(last=False)
+            _mem_cache_bytes -= len(evicted)
+
 import re as _re
 def _safe_username(name: str) -> str:
     """Sanitize username to a safe directory name."""
     name = _re.sub(r'[^\w\-]', '_', name.strip())
     return name[:64] or "anonymous"
 
-# Only one synthesis at a time
+# The job currently being synthesized, for progress reporting. Requests are
+# no longer rejected while it is set — they queue on _synth_executor and run
+# in submission order. Reads are lock-free (name rebinding is atomic under
+# the GIL); the lock is only taken when the worker claims/releases it.
 active_job_id = None
 active_lock = threading.Lock()
 
-# Load config
+
+def _active_job():
+    """Lock-free snapshot of the currently running job, if any."""
+    job_id = active_job_id
+    if job_id is None:
+        return None
+    job = jobs.get(job_id)
+    if job is not None and job.status in ("pending", "processing"):
+        return job
+    return None
+
+# Long-lived synthesis workers; submissions queue in FIFO order instead of
+# being rejected with 503 while a job is running. Default is one worker
+# because the GGUF backbone is not thread-safe; VIENEU_SYNTH_WORKERS can be
+# raised for backends that tolerate concurrent inference (e.g. ONNX codec
+# with intra-op threads capped).
+_SYNTH_WORKERS = max(1, int(os.environ.get("VIENEU_SYNTH_WORKERS", "1")))
+_synth_executor = ThreadPoolExecutor(max_workers=_SYNTH_WORKERS,
+                                     thread_name_prefix="synth")
+
+# Bounded pool for short-lived I/O helpers (ffmpeg feeders, process refills):
+# reuses threads across requests and caps how many a client burst can create.
+_io_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="io")
+
+# Single postprocessing worker: int16 conversion and PCM publishing for a
+# finished chunk run here so the synthesis thread can start inferring the
+# next chunk immediately (the backbone releases the GIL inside its C/C++
+# decode loop, so the overlap is real). One worker keeps chunk order.
+_postproc_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="postproc")
+
+# Load config. CSafeLoader is the libyaml C parser — roughly 10x faster
+# than the pure-Python loader, which matters for process start time; fall
+# back when PyYAML was built without libyaml.
 CONFIG_PATH = Path(__file__).parent / "config.yaml"
 with open(CONFIG_PATH) as f:
-    config = yaml.safe_load(f)
+    config = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
 BACKBONE_CONFIGS = config["backbone_configs"]
 CODEC_CONFIGS = config["codec_configs"]
@@ -82,24 +384,156 @@ DEFAULT_BACKBONE = "VieNeu-TTS-0.3B-q4-gguf"
 DEFAULT_CODEC = "NeuCodec ONNX (Fast CPU)"
 DEFAULT_VOICE = "Binh"
 
+
+@lru_cache(maxsize=1)
+def _accel_device():
+    """Probe torch once for the best available accelerator.
+
+    torch.cuda.is_available()/mps.is_available() poke the driver; caching
+    keeps that out of every /api/load_model call.
+    """
+    import torch
+
+    if sys.platform == "darwin":
+        return "mps" if torch.backends.mps.is_available() else "cpu"
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+@lru_cache(maxsize=32)
+def _select_devices(backbone_choice, codec_choice):
+    """Memoized (backbone_device, codec_device) for a model selection.
+
+    GGUF backbones run through llama.cpp on CPU; the ONNX codec is CPU-only.
+    Everything else gets the probed accelerator.
+    """
+    repo = BACKBONE_CONFIGS[backbone_choice]["repo"]
+    backbone_device = "cpu" if "gguf" in repo.lower() else _accel_device()
+    codec_device = "cpu" if "ONNX" in codec_choice else _accel_device()
+    return backbone_device, codec_device
+
 # ---------------------------------------------------------------------------
 # API endpoints
 # ---------------------------------------------------------------------------
 
+# The model/codec catalogs are immutable after config load, so their JSON
+# bodies are encoded once at import and the endpoints return cached bytes
+# with an ETag — the UI hits both on every page load, so repeats are 304s.
+_MODELS_JSON = _json_dumps(
+    [{"name": n, "repo": c["repo"], "description": c["description"]}
+     for n, c in BACKBONE_CONFIGS.items()]).encode()
+_CODECS_JSON = _json_dumps(
+    [{"name": n, "repo": c["repo"], "description": c["description"]}
+     for n, c in CODEC_CONFIGS.items()]).encode()
+_MODELS_ETAG = hashlib.md5(_MODELS_JSON).hexdigest()
+_CODECS_ETAG = hashlib.md5(_CODECS_JSON).hexdigest()
+
+
+def _catalog_response(body, etag):
+    if request.if_none_match.contains(etag):
+        return "", 304
+    resp = Response(body, mimetype="application/json")
+    resp.set_etag(etag)
+    resp.headers["Cache-Control"] = "max-age=60"
+    return resp
+
+
 @app.get("/api/models")
 def list_models():
-    models = []
-    for name, cfg in BACKBONE_CONFIGS.items():
-        models.append({"name": name, "repo": cfg["repo"], "description": cfg["description"]})
-    return jsonify(models)
+    return _catalog_response(_MODELS_JSON, _MODELS_ETAG)
 
 
 @app.get("/api/codecs")
 def list_codecs():
-    codecs = []
-    for name, cfg in CODEC_CONFIGS.items():
-        codecs.append({"name": name, "repo": cfg["repo"], "description": cfg["description"]})
-    return jsonify(codecs)
+    return _catalog_response(_CODECS_JSON, _CODECS_ETAG)
+
+
+# Loaded models kept alive keyed by (backbone, codec) so switching back to
+# a recent selection skips the multi-second weight reload. Small LRU: each
+# entry holds full model weights, so the cap defaults to 2 (tunable via
+# VIENEU_MODEL_CACHE_SIZE); evicted models are closed.
+_model_cache = OrderedDict()
+_MODEL_CACHE_SIZE = max(1, int(os.environ.get("VIENEU_MODEL_CACHE_SIZE", "2")))
+
+# Jobs hold a submit-time reference to their model, so an LRU eviction
+# must not close an instance that still has work queued or running —
+# close() mid-infer tears the backbone down under the worker. Models carry
+# an active-job count; eviction marks them retired and the last release
+# performs the deferred close.
+_model_refs_lock = threading.Lock()
+
+
+def _acquire_model(model):
+    """Count a queued/running job against the model (pairs with release)."""
+    with _model_refs_lock:
+        model.active_jobs = getattr(model, "active_jobs", 0) + 1
+
+
+def _release_model(model):
+    """Drop a job's reference; close the model if it was evicted meanwhile."""
+    with _model_refs_lock:
+        model.active_jobs -= 1
+        close_now = model.active_jobs == 0 and getattr(model, "retired", False)
+    if close_now:
+        try:
+            model.close()
+        except Exception:
+            pass
+
+
+@lru_cache(maxsize=1)
+def _pin_compute_threads():
+    """Cap intra-op thread pools to the per-worker CPU share, once.
+
+    Torch and the BLAS/OpenMP runtimes each default their pools to every
+    core; with VIENEU_SYNTH_WORKERS > 1 that oversubscribes the machine and
+    concurrent chunks slow each other down more than they overlap. The env
+    vars only take effect for runtimes not yet initialized, hence the
+    setdefault-before-model-construction placement.
+    """
+    per_worker = max(1, (os.cpu_count() or 1) // _SYNTH_WORKERS)
+    os.environ.setdefault("OMP_NUM_THREADS", str(per_worker))
+    os.environ.setdefault("MKL_NUM_THREADS", str(per_worker))
+    try:
+        import torch
+        torch.set_num_threads(per_worker)
+        torch.set_num_interop_threads(1)
+    except Exception:
+        # set_num_interop_threads raises once parallel work has started.
+        pass
+
+
+def _get_or_load_model(backbone_choice, codec_choice):
+    """Return a (possibly cached) VieNeuTTS for the selection and warm it."""
+    _pin_compute_threads()
+    from vieneu import VieNeuTTS
+
+    key = (backbone_choice, codec_choice)
+    cached = _model_cache.get(key)
+    if cached is not None:
+        _model_cache.move_to_end(key)
+        return cached
+
+    backbone_device, codec_device = _select_devices(backbone_choice, codec_choice)
+    model = VieNeuTTS(
+        backbone_repo=BACKBONE_CONFIGS[backbone_choice]["repo"],
+        backbone_device=backbone_device,
+        codec_repo=CODEC_CONFIGS[codec_choice]["repo"],
+        codec_device=codec_device,
+    )
+    _warmup_tts(model)
+
+    _model_cache[key] = model
+    while len(_model_cache) > _MODEL_CACHE_SIZE:
+        _, evicted = _model_cache.popitem(last=False)
+        with _model_refs_lock:
+            evicted.retired = True
+            busy = getattr(evicted, "active_jobs", 0) > 0
+        if not busy:
+            try:
+                evicted.close()
+            except Exception:
+                pass
+    return model
 
 
 @app.post("/api/load_model")
@@ -115,48 +549,27 @@ def load_model():
     if codec_choice not in CODEC_CONFIGS:
         return jsonify({"error": f"Unknown codec: {codec_choice}"}), 400
 
-    backbone_cfg = BACKBONE_CONFIGS[backbone_choice]
-    codec_cfg = CODEC_CONFIGS[codec_choice]
-
-    # Determine devices
-    import torch
-
-    if "gguf" in backbone_cfg["repo"].lower():
-        backbone_device = "cpu"
-    elif sys.platform == "darwin":
-        backbone_device = "mps" if torch.backends.mps.is_available() else "cpu"
-    else:
-        backbone_device = "cuda" if torch.cuda.is_available() else "cpu"
-
-    if "ONNX" in codec_choice:
-        codec_device = "cpu"
-    elif sys.platform == "darwin":
-        codec_device = "mps" if torch.backends.mps.is_available() else "cpu"
-    else:
-        codec_device = "cuda" if torch.cuda.is_available() else "cpu"
+    backbone_device, codec_device = _select_devices(backbone_choice, codec_choice)
 
-    if "gguf" in backbone_cfg["repo"].lower() and backbone_device == "cuda":
-        backbone_device = "gpu"
-
-    # Close previous model
-    if tts is not None:
-        try:
-            tts.close()
-        except Exception:
-            pass
+    # Idempotent: re-requesting the active selection (e.g. the UI's Load
+    # button on page open) must not trigger any model work.
+    if (model_loaded and backbone_choice == current_backbone
+            and codec_choice == current_codec):
+        return jsonify({
+            "ok": True,
+            "already_loaded": True,
+            "backbone": backbone_choice,
+            "codec": codec_choice,
+            "backbone_device": backbone_device,
+            "codec_device": codec_device,
+        })
 
     try:
-        from vieneu import VieNeuTTS
-
-        tts = VieNeuTTS(
-            backbone_repo=backbone_cfg["repo"],
-            backbone_device=backbone_device,
-            codec_repo=codec_cfg["repo"],
-            codec_device=codec_device,
-        )
+        tts = _get_or_load_model(backbone_choice, codec_choice)
         model_loaded = True
         current_backbone = backbone_choice
         current_codec = codec_choice
+        model_ready.set()
 
         return jsonify({
             "ok": True,
@@ -171,34 +584,53 @@ def load_model():
         return jsonify({"error": str(e)}), 500
 
 
+@app.get("/api/health")
+def health():
+    """Readiness probe: the UI opens immediately while the preload thread
+    is still pulling weights, and checks here before offering to load."""
+    return jsonify({
+        "ready": model_ready.is_set() and model_loaded,
+        "backbone": current_backbone,
+        "codec": current_codec,
+    })
+
+
 @app.get("/api/voices")
 def list_voices():
     if tts is None:
         return jsonify([])
     try:
         voices = tts.list_preset_voices()
-        return jsonify([{"description": desc, "id": vid} for desc, vid in voices])
+        return jsonify([
+            {"description": desc, "id": vid,
+             "preview_url": (f"/previews/{_safe_username(vid)}.wav"
+                             if _preview_path(vid).exists() else None)}
+            for desc, vid in voices
+        ])
     except Exception:
         return jsonify([])
 
 
+@app.get("/previews/<voice_id>.wav")
+def get_voice_preview(voice_id):
+    path = _preview_path(voice_id)
+    if not path.exists():
+        return jsonify({"error": "Preview not available"}), 404
+    return send_file(str(path), mimetype="audio/wav",
+                     as_attachment=False, conditional=True, max_age=86400)
+
+
 @app.post("/api/synthesize")
 def synthesize():
-    global active_job_id
-
     if not model_loaded or tts is None:
         return jsonify({"error": "Model not loaded"}), 400
 
-    # Check if another job is already running
-    with active_lock:
-        if active_job_id is not None:
-            job = jobs.get(active_job_id, {})
-            if job.get("status") in ("pending", "processing"):
-                return jsonify({
-                    "error": "Server is busy generating audio for another client. Please wait and try again.",
-                    "busy": True,
-                    "active_progress": job.get("progress", ""),
-                }), 503
+    # Snapshot the selection now: /api/load_model can swap the globals
+    # while this job waits in the queue, and a job keyed to backbone A
+    # must not synthesize (and publish into cache/<keyA>) with model B.
+    model = tts
+    backbone = current_backbone
+    codec = current_codec
 
     # Support both JSON and multipart form (for file uploads)
     if request.content_type and "multipart/form-data" in request.content_type:
@@ -208,6 +640,7 @@ def synthesize():
         temperature = float(request.form.get("temperature", "1.0"))
         username = request.form.get("username", "")
         ref_audio_file = request.files.get("ref_audio")
+        voice_ref_id = request.form.get("voice_ref_id", "")
     else:
         data = request.get_json()
         text = data.get("text", "").strip()
@@ -216,74 +649,445 @@ def synthesize():
         temperature = data.get("temperature", 1.0)
         username = data.get("username", "")
         ref_audio_file = None
+        voice_ref_id = data.get("voice_ref_id", "")
 
     if not text:
         return jsonify({"error": "Text is required"}), 400
 
-    # Save uploaded ref audio to temp file if present
+    # Save uploaded ref audio to temp file if present. The upload is hashed
+    # while reading: if the same bytes were encoded before, the temp file
+    # and the codec forward pass are both skipped. Cached codes are
+    # resolved here, at submit — the LRU can evict the key while the job
+    # sits in the queue, and a worker-side miss would silently fall back
+    # to the default voice and then poison the synthesis cache under this
+    # reference's digest. Holding the array itself pins it alive.
     ref_audio_path = None
+    ref_cache_key = None
+    ref_codes = None
     if ref_audio_file:
-        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-        ref_audio_file.save(tmp.name)
-        tmp.close()
-        ref_audio_path = tmp.name
+        hasher = hashlib.blake2b(digest_size=16)
+        blocks = []
+        while True:
+            block = ref_audio_file.stream.read(1024 * 1024)
+            if not block:
+                break
+            hasher.update(block)
+            blocks.append(block)
+        ref_cache_key = (codec, hasher.hexdigest())
+        ref_codes = _ref_encode_cache.get(ref_cache_key)
+        if ref_codes is not None:
+            _ref_encode_cache.move_to_end(ref_cache_key)
+        else:
+            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
+            with tmp:
+                for block in blocks:
+                    tmp.write(block)
+            ref_audio_path = tmp.name
+    elif voice_ref_id:
+        # Reference previously registered via /api/register_voice: no upload
+        # and no re-encoding, just the cached codes.
+        ref_cache_key = (codec, voice_ref_id)
+        ref_codes = _ref_encode_cache.get(ref_cache_key)
+        if ref_codes is None:
+            return jsonify({
+                "error": "Unknown voice_ref_id — register the reference audio again",
+            }), 400
+        _ref_encode_cache.move_to_end(ref_cache_key)
+
+    # Content-addressed synthesis cache: the exact same request (text,
+    # voice, temperature, reference audio, model selection) produces the
+    # same audio, so a repeat is answered from cache/ without touching the
+    # model at all.
+    username = _safe_username(username)
+    synth_key = hashlib.sha256(_json_dumps({
+        "text": text,
+        "voice_id": voice_id,
+        "temperature": temperature,
+        "ref": ref_cache_key[-1] if ref_cache_key else "",
+        "ref_text": ref_text,
+        "backbone": backbone,
+        "codec": codec,
+    }).encode()).hexdigest()
+    cached_wav = CACHE_DIR / f"{synth_key}.wav"
+    cached_bytes = _mem_cache_get(synth_key)
+    if cached_bytes is not None or cached_wav.exists():
+        if ref_audio_path:
+            try:
+                os.unlink(ref_audio_path)
+            except OSError:
+                pass
+        return jsonify({"job_id": _job_from_cache(cached_wav, username,
+                                                  cached_bytes, synth_key),
+                        "cached": True})
+
+    # Coalesce identical in-flight requests: a second row with the same
+    # text/voice/settings (repeated filler phrases in "Generate All"
+    # batches) attaches to the job already queued or running instead of
+    # synthesizing the same audio twice. Both rows watch the same job_id.
+    with _inflight_lock:
+        existing = _inflight.get(synth_key)
+        if existing is not None:
+            ejob = jobs.get(existing)
+            if ejob is not None and ejob.status in ("pending", "processing"):
+                if ref_audio_path:
+                    try:
+                        os.unlink(ref_audio_path)
+                    except OSError:
+                        pass
+                return jsonify({"job_id": existing, "coalesced": True})
+
+        # Always accepted: the job queues on the synthesis executor and runs
+        # as soon as a worker is free, so concurrent clients wait instead of
+        # retrying against a 503.
+        job_id = str(uuid.uuid4())
+        jobs[job_id] = Job()
+        _inflight[synth_key] = job_id
+
+    # Released in the worker's finally; keeps the snapshot safe from an
+    # eviction close while the job waits its turn.
+    _acquire_model(model)
+    _synth_executor.submit(
+        _run_synthesis,
+        job_id, text, voice_id, ref_audio_path, ref_text, temperature,
+        username, ref_cache_key, synth_key, ref_codes, model, codec,
+    )
 
-    job_id = str(uuid.uuid4())
-    jobs[job_id] = {
-        "status": "pending", "progress": "Queued",
-        "audio_path": None, "error": None,
-        "chunks_total": 0, "chunks_done": 0,
-        "pcm_queue": queue.Queue(maxsize=200),
-        "cancelled": False,
-    }
+    return jsonify({"job_id": job_id})
 
-    with active_lock:
-        active_job_id = job_id
 
-    thread = threading.Thread(
-        target=_run_synthesis,
-        args=(job_id, text, voice_id, ref_audio_path, ref_text, temperature, _safe_username(username)),
-        daemon=True,
-    )
-    thread.start()
+def _job_from_cache(cached_wav, username, data=None, synth_key=None):
+    """Materialize an already-done job from a cached WAV.
 
-    return jsonify({"job_id": job_id})
+    The cached file is hard-linked (copied across filesystems) into the
+    user's history directory, and its PCM is replayed into pcm_history so
+    the streaming endpoints behave exactly as for a fresh job. data is the
+    in-memory tier's copy of the WAV bytes, if it had one.
+    """
+    job_id = str(uuid.uuid4())
+    job = Job()
+
+    user_dir = OUTPUTS_DIR / username
+    user_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    audio_path = str(user_dir / f"{timestamp}_{job_id[:8]}.wav")
+    if data is not None and not cached_wav.exists():
+        # Memory hit but the disk entry was removed out from under us.
+        Path(audio_path).write_bytes(data)
+    else:
+        try:
+            os.link(cached_wav, audio_path)
+        except OSError:
+            shutil.copyfile(cached_wav, audio_path)
+
+    if data is None:
+        data = Path(audio_path).read_bytes()
+        if synth_key is not None:
+            _mem_cache_put(synth_key, data)
+    job.audio_path = audio_path
+    if len(data) < _AUDIO_CACHE_MAX_BYTES:
+        job.audio_bytes = data
+    st = os.stat(audio_path)
+    job.etag = hashlib.md5(
+        f"{audio_path}{st.st_mtime}{st.st_size}".encode()).hexdigest()
+    job.pcm_history.append(data[44:])  # skip the canonical 44-byte header
+    job.pcm_done = True
+    job.chunks_total = 1
+    job.chunks_done = 1
+    job.status = "done"
+    job.progress = "Done (cached)"
+    job.completed_at = time.monotonic()
+    jobs[job_id] = job
+    # Usually a no-op encode: the cache entry's .opus already exists, so the
+    # task just points the new job record at it.
+    _encode_opus_async(job_id, audio_path, synth_key)
+    return job_id
+
+
+@app.post("/api/register_voice")
+def register_voice():
+    """Encode an uploaded reference once and hand back a reusable id.
+
+    Batch flows ("Generate All" with a cloned voice) used to re-upload the
+    same multi-MB file and re-encode the speaker for every row. The id is
+    the content hash of the upload; /api/synthesize accepts it in place of
+    the file and resolves it through _ref_encode_cache.
+    """
+    if not model_loaded or tts is None:
+        return jsonify({"error": "Model not loaded"}), 400
+    ref_audio_file = request.files.get("ref_audio")
+    if not ref_audio_file:
+        return jsonify({"error": "ref_audio file is required"}), 400
+
+    # Snapshot: the encode runs behind whatever is queued on the synthesis
+    # executor, and a model swap in the meantime must not change which
+    # codec the codes are attributed to.
+    model = tts
+    codec = current_codec
+
+    buf = ref_audio_file.read()
+    digest = hashlib.blake2b(buf, digest_size=16).hexdigest()
+    key = (codec, digest)
+    if key in _ref_encode_cache:
+        _ref_encode_cache.move_to_end(key)
+        return jsonify({"voice_ref_id": digest, "cached": True})
+
+    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
+    with tmp:
+        tmp.write(buf)
+
+    def encode():
+        try:
+            return _prepare_ref_codes(model.encode_reference(tmp.name))
+        finally:
+            try:
+                os.unlink(tmp.name)
+            except OSError:
+                pass
+
+    # Serialized on the synthesis executor — the codec is not thread-safe
+    # against a concurrently running job.
+    _acquire_model(model)
+    try:
+        ref_codes = _synth_executor.submit(encode).result()
+    finally:
+        _release_model(model)
+    _ref_encode_cache[key] = ref_codes
+    while len(_ref_encode_cache) > _REF_ENCODE_CACHE_SIZE:
+        _ref_encode_cache.popitem(last=False)
+    return jsonify({"voice_ref_id": digest, "cached": False})
 
 
 @app.get("/api/busy")
 def check_busy():
     if not model_loaded:
         return jsonify({"busy": True, "reason": "Model loading..."})
-    with active_lock:
-        if active_job_id is not None:
-            job = jobs.get(active_job_id, {})
-            if job.get("status") in ("pending", "processing"):
-                return jsonify({"busy": True, "active_progress": job.get("progress", "")})
+    job = _active_job()
+    if job is not None:
+        return jsonify({"busy": True, "active_progress": job.progress})
     return jsonify({"busy": False})
 
 
+class _PcmListener:
+    """Deque + Event PCM handoff between the synthesis worker and a
+    streaming response thread.
+
+    deque.append/popleft are atomic under the GIL, so the producer never
+    takes a lock; the Event only comes into play when the consumer has
+    drained the buffer and needs to sleep. This avoids queue.Queue's
+    mutex/condition handshake on every chunk.
+    """
+
+    __slots__ = ("_buf", "_ready")
+
+    def __init__(self):
+        self._buf = deque()
+        self._ready = threading.Event()
+
+    def put(self, data):
+        self._buf.append(data)
+        self._ready.set()
+
+    def get(self, timeout=None):
+        while True:
+            try:
+                return self._buf.popleft()
+            except IndexError:
+                self._ready.clear()
+                if self._buf:  # producer raced in between popleft and clear
+                    continue
+                if not self._ready.wait(timeout):
+                    raise queue.Empty
+
+
+def _publish_pcm(job, data):
+    """Fan raw PCM out to every stream subscriber of this job.
+
+    data is a bytes-like chunk, or None to mark end-of-stream. Chunks are
+    also kept in pcm_history so a listener that connects mid-job (or
+    reconnects) can replay the audio from the start.
+
+    pcm_lock orders the history append against a concurrent subscriber's
+    replay: without it a chunk published between a subscriber's history
+    copy and its listener registration reaches neither path and the
+    stream plays with a gap. Only the bookkeeping is locked — the per-
+    chunk puts to the listener deques stay lock-free, and mutual
+    exclusion with _subscribe_pcm guarantees a listener in the snapshot
+    had not yet replayed this chunk.
+    """
+    with job.pcm_lock:
+        if data is None:
+            job.pcm_done = True
+        else:
+            job.pcm_history.append(data)
+        listeners = list(job.pcm_listeners)
+    for q in listeners:
+        q.put(data)
+
+
+def _subscribe_pcm(job):
+    """Attach a new PCM listener, pre-filled with history so far.
+
+    The replay happens under pcm_lock, before the listener is visible to
+    _publish_pcm: registering first would let a live chunk land in the
+    deque ahead of the history it follows.
+    """
+    q = _PcmListener()
+    with job.pcm_lock:
+        for data in job.pcm_history:
+            q.put(data)
+        job.pcm_listeners.append(q)
+        done = job.pcm_done
+    if done:
+        q.put(None)
+    return q
+
+
+def _wav_stream_header(sr, channels=1, bits=16):
+    """RIFF/WAVE header with maxed-out sizes for progressive streaming.
+
+    Players treat the 0xFFFFFFFF chunk sizes as "read until EOF", which is
+    the conventional way to serve a WAV whose length is not yet known.
+    """
+    byte_rate = sr * channels * bits // 8
+    block_align = channels * bits // 8
+    return b"".join([
+        b"RIFF", struct.pack("<I", 0xFFFFFFFF), b"WAVE",
+        b"fmt ", struct.pack("<IHHIIHH", 16, 1, channels, sr,
+                             byte_rate, block_align, bits),
+        b"data", struct.pack("<I", 0xFFFFFFFF),
+    ])
+
+
+def _status_payload(job_id, job):
+    """Build the status dict shared by /api/status and /api/events."""
+    resp = {"status": job.status, "progress": job.progress}
+    if job.status == "done":
+        resp["audio_url"] = f"/api/audio/{job_id}"
+        # Only advertised once the async encode has landed; clients that
+        # saw the done event first simply keep using the WAV.
+        if job.opus_path is not None:
+            resp["audio_url_opus"] = f"/api/audio/{job_id}.opus"
+    if job.error:
+        resp["error"] = job.error
+    resp["chunks_done"] = job.chunks_done
+    resp["chunks_total"] = job.chunks_total
+    return resp
+
+
+def _set_job(job_id, **fields):
+    """Update job fields and push the new status to all SSE listeners."""
+    job = jobs.get(job_id)
+    if job is None:
+        return
+    for name, value in fields.items():
+        setattr(job, name, value)
+    if fields.get("status") in ("done", "error"):
+        job.completed_at = time.monotonic()
+    payload = _status_payload(job_id, job)
+    for q in list(job.listeners):
+        try:
+            q.put_nowait(payload)
+        except queue.Full:
+            pass
+
+
 @app.get("/api/status/<job_id>")
 def job_status(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(_status_payload(job_id, job))
+
+
+@app.post("/api/status_batch")
+def job_status_batch():
+    """Status for many jobs in one request.
+
+    The polling fallback in the frontend coalesces every active row into a
+    single 1 Hz request here instead of one /api/status call per row.
+    Unknown job ids are simply omitted from the response.
+    """
+    data = request.get_json(silent=True) or {}
+    out = {}
+    for job_id in data.get("job_ids", []):
+        job = jobs.get(job_id)
+        if job is not None:
+            out[job_id] = _status_payload(job_id, job)
+    return jsonify(out)
+
+
+@app.get("/api/events/<job_id>")
+def job_events(job_id):
+    """Server-Sent Events stream of job status updates.
+
+    One persistent connection replaces the 1 Hz polling of /api/status:
+    progress and chunks_done changes are pushed as soon as the synthesis
+    worker records them.
+    """
     job = jobs.get(job_id)
     if job is None:
         return jsonify({"error": "Job not found"}), 404
 
-    resp = {"status": job["status"], "progress": job["progress"]}
-    if job["status"] == "done":
-        resp["audio_url"] = f"/api/audio/{job_id}"
-    if job["error"]:
-        resp["error"] = job["error"]
-    resp["chunks_done"] = job.get("chunks_done", 0)
-    resp["chunks_total"] = job.get("chunks_total", 0)
-    return jsonify(resp)
+    q = queue.Queue(maxsize=100)
+    job.listeners.append(q)
+
+    def generate():
+        try:
+            # Initial snapshot so a reconnecting client catches up immediately
+            payload = _status_payload(job_id, job)
+            yield f"data: {_json_dumps(payload)}\n\n"
+            while payload.get("status") not in ("done", "error"):
+                try:
+                    payload = q.get(timeout=15)
+                except queue.Empty:
+                    # Comment line keeps proxies/browsers from dropping the stream
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"data: {_json_dumps(payload)}\n\n"
+        finally:
+            try:
+                job.listeners.remove(q)
+            except ValueError:
+                pass
+
+    return Response(generate(), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache",
+                             "X-Accel-Buffering": "no"})
 
 
 @app.get("/api/audio/<job_id>")
 def get_audio(job_id):
     job = jobs.get(job_id)
-    if job is None or job["audio_path"] is None:
+    if job is None or job.audio_path is None:
         return jsonify({"error": "Audio not available"}), 404
-    return send_file(job["audio_path"], mimetype="audio/wav", as_attachment=False)
+    # The ETag is computed once when the WAV is written; a matching
+    # If-None-Match (browser re-fetch / <audio> reload) answers 304 without
+    # touching the file.
+    if job.etag and request.if_none_match.contains(job.etag):
+        return "", 304
+    # Small WAVs are kept in memory when the job finishes, so repeat
+    # downloads never touch the disk; send_file on BytesIO still gives
+    # Range and conditional handling.
+    if job.audio_bytes is not None:
+        return send_file(io.BytesIO(job.audio_bytes), mimetype="audio/wav",
+                         as_attachment=False, conditional=True,
+                         etag=job.etag or True, max_age=3600)
+    # conditional=True enables Range/If-Modified-Since and lets werkzeug hand
+    # the open file to wsgi.file_wrapper, so sendfile-capable servers
+    # (e.g. gunicorn gthread) transmit the WAV with kernel zero-copy.
+    return send_file(job.audio_path, mimetype="audio/wav",
+                     as_attachment=False, conditional=True,
+                     etag=job.etag or True, max_age=3600)
+
+
+@app.get("/api/audio/<job_id>.opus")
+def get_audio_opus(job_id):
+    """Compressed rendition of a finished job (encoded by _encode_opus_async)."""
+    job = jobs.get(job_id)
+    if job is None or job.opus_path is None or not os.path.exists(job.opus_path):
+        return jsonify({"error": "Opus audio not available"}), 404
+    return send_file(job.opus_path, mimetype="audio/ogg",
+                     as_attachment=False, conditional=True, max_age=3600)
 
 
 @app.get("/api/history")
@@ -305,7 +1109,8 @@ def get_history_file(username, filename):
     path = OUTPUTS_DIR / username / filename
     if not path.exists() or path.suffix != ".wav":
         return jsonify({"error": "File not found"}), 404
-    return send_file(str(path), mimetype="audio/wav", as_attachment=False)
+    return send_file(str(path), mimetype="audio/wav",
+                     as_attachment=False, conditional=True)
 
 
 @app.post("/api/cancel/<job_id>")
@@ -313,24 +1118,116 @@ def cancel_job(job_id):
     job = jobs.get(job_id)
     if job is None:
         return jsonify({"error": "Job not found"}), 404
-    job["cancelled"] = True
+    job.cancelled = True
     # Kill any running ffmpeg stream process
-    proc = job.get("ffmpeg_proc")
+    proc = job.ffmpeg_proc
     if proc:
         try:
             proc.terminate()
         except Exception:
             pass
-    # Unblock the feeder thread by signalling end-of-stream
-    pcm_q = job.get("pcm_queue")
-    if pcm_q:
-        try:
-            pcm_q.put_nowait(None)
-        except queue.Full:
-            pass
+    # Unblock stream listeners by signalling end-of-stream
+    _publish_pcm(job, None)
     return jsonify({"ok": True})
 
 
+def _encode_opus_async(job_id, wav_path, synth_key=None):
+    """Encode a finished WAV to ~32 kbps Opus off the request path.
+
+    The WAV stays the canonical artifact (history, downloads); the Opus
+    rendition is ~10x smaller, so repeat playback over the network starts
+    faster and costs a fraction of the bandwidth. Cache-keyed jobs encode
+    into cache/<key>.opus so the work happens once per distinct synthesis;
+    the job record picks up the path when the encode lands, and the status
+    payload starts advertising audio_url_opus from then on.
+    """
+    def task():
+        if synth_key is not None:
+            target = str(CACHE_DIR / f"{synth_key}.opus")
+        else:
+            target = wav_path[:-4] + ".opus"
+        if not os.path.exists(target):
+            part = target + ".part"
+            try:
+                subprocess.run(
+                    ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+                     "-i", wav_path, "-c:a", "libopus", "-b:a", "32k", part],
+                    check=True, stdin=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL)
+                os.replace(part, target)
+            except Exception as e:
+                logging.warning("Opus encode of %s failed: %s", wav_path, e)
+                try:
+                    os.unlink(part)
+                except OSError:
+                    pass
+                return
+        job = jobs.get(job_id)
+        if job is not None:
+            job.opus_path = target
+
+    _io_executor.submit(task)
+
+
+# ffmpeg is kept for Opus encoding on purpose: the browser MediaSource
+# player requires a WebM container, and the in-process Opus bindings
+# (pyogg/opuslib) only produce raw packets or seekable Ogg files — neither
+# can be muxed into a live WebM stream without reimplementing the muxer.
+# The warm-process pool below already hides the spawn cost.
+_FFMPEG_OPUS_CMD = [
+    "ffmpeg", "-hide_banner", "-loglevel", "error",
+    "-f", "s16le", "-ar", "24000", "-ac", "1", "-i", "pipe:0",
+    "-c:a", "libopus", "-b:a", "64k",
+    "-f", "webm", "pipe:1",
+]
+
+# One pre-spawned encoder sitting idle on stdin. A WebM stream is a single
+# encoder session, so a process cannot be reused across jobs — but keeping
+# the next one warm takes ffmpeg startup (~50-100ms) off stream latency.
+_ffmpeg_pool = queue.Queue(maxsize=1)
+
+
+def _spawn_ffmpeg():
+    proc = subprocess.Popen(
+        _FFMPEG_OPUS_CMD,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        # Unbuffered pipes: PCM bytes go straight to the fd instead of being
+        # copied through a BufferedWriter first.
+        bufsize=0,
+    )
+    # Enlarge the stdin pipe (Linux) so a whole synthesis chunk fits in one
+    # write instead of bouncing through 64KB pipe-buffer slices.
+    try:
+        import fcntl
+        F_SETPIPE_SZ = 1031
+        fcntl.fcntl(proc.stdin.fileno(), F_SETPIPE_SZ, 1 << 20)
+    except (ImportError, OSError):
+        pass
+    return proc
+
+
+def _refill_ffmpeg_pool():
+    if _ffmpeg_pool.full():
+        return
+    proc = _spawn_ffmpeg()
+    try:
+        _ffmpeg_pool.put_nowait(proc)
+    except queue.Full:
+        proc.kill()
+
+
+def _get_ffmpeg():
+    """Take the warm encoder (spawning one if empty) and refill in background."""
+    try:
+        proc = _ffmpeg_pool.get_nowait()
+    except queue.Empty:
+        proc = _spawn_ffmpeg()
+    _io_executor.submit(_refill_ffmpeg_pool)
+    return proc
+
+
 @app.get("/api/stream/<job_id>")
 def stream_audio(job_id):
     """Stream audio as WebM/Opus for MediaSource API consumption."""
@@ -338,38 +1235,29 @@ def stream_audio(job_id):
     if job is None:
         return jsonify({"error": "Job not found"}), 404
 
-    pcm_queue = job.get("pcm_queue")
-    if pcm_queue is None:
-        return jsonify({"error": "No stream available"}), 404
+    pcm_queue = _subscribe_pcm(job)
 
-    proc = subprocess.Popen(
-        [
-            "ffmpeg", "-hide_banner", "-loglevel", "error",
-            "-f", "s16le", "-ar", "24000", "-ac", "1", "-i", "pipe:0",
-            "-c:a", "libopus", "-b:a", "64k",
-            "-f", "webm", "pipe:1",
-        ],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.DEVNULL,
-    )
-    job["ffmpeg_proc"] = proc
+    proc = _get_ffmpeg()
+    job.ffmpeg_proc = proc
 
     def feed_pcm():
         try:
             while True:
-                if job.get("cancelled"):
+                if job.cancelled:
                     break
                 try:
                     data = pcm_queue.get(timeout=2)
                 except queue.Empty:
-                    if job.get("cancelled"):
+                    if job.cancelled:
                         break
                     continue
                 if data is None:
                     break
-                proc.stdin.write(data)
-                proc.stdin.flush()
+                # Raw fd write; loop in case of a short write on large chunks
+                view = memoryview(data)
+                while view:
+                    written = proc.stdin.write(view)
+                    view = view[written:]
         except (BrokenPipeError, OSError):
             pass
         finally:
@@ -378,8 +1266,7 @@ def stream_audio(job_id):
             except Exception:
                 pass
 
-    feeder = threading.Thread(target=feed_pcm, daemon=True)
-    feeder.start()
+    _io_executor.submit(feed_pcm)
 
     def generate():
         try:
@@ -394,133 +1281,384 @@ def stream_audio(job_id):
             except Exception:
                 pass
             proc.wait()
-            job.pop("ffmpeg_proc", None)
+            job.ffmpeg_proc = None
+            try:
+                job.pcm_listeners.remove(pcm_queue)
+            except ValueError:
+                pass
 
     return Response(generate(), mimetype="audio/webm",
                     headers={"Cache-Control": "no-cache",
                              "X-Content-Type-Options": "nosniff"})
 
 
+@app.get("/api/stream_wav/<job_id>")
+def stream_wav(job_id):
+    """Stream the job's audio as WAV while it is still being generated.
+
+    Emits a streaming RIFF header followed by PCM chunks as the worker
+    produces them, so a client can play/save the WAV without waiting for
+    the job to finish and the final file to be written.
+    """
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+
+    pcm_queue = _subscribe_pcm(job)
+
+    def generate():
+        try:
+            yield _wav_stream_header(24_000 if tts is None else tts.sample_rate)
+            while True:
+                try:
+                    data = pcm_queue.get(timeout=2)
+                except queue.Empty:
+                    if job.cancelled:
+                        break
+                    continue
+                if data is None:
+                    break
+                yield data
+        finally:
+            try:
+                job.pcm_listeners.remove(pcm_queue)
+            except ValueError:
+                pass
+
+    return Response(generate(), mimetype="audio/wav",
+                    headers={"Cache-Control": "no-cache",
+                             "X-Content-Type-Options": "nosniff"})
+
+
 # ---------------------------------------------------------------------------
 # Background synthesis worker
 # ---------------------------------------------------------------------------
 
-def _run_synthesis(job_id, text, voice_id, ref_audio_path, ref_text, temperature, username="anonymous"):
-    global active_job_id
-    import numpy as np
+@lru_cache(maxsize=4)
+def _silence_pcm16(sr, seconds=0.15):
+    """Cached int16 PCM silence inserted between streamed chunks.
+
+    int16 zeros are all-zero bytes, so the padding is just a cached bytes
+    object instead of a fresh np.zeros(...).tobytes() per chunk.
+    """
+    return bytes(2 * int(seconds * sr))
+
+
+@lru_cache(maxsize=4)
+def _silence_f32(sr, seconds=0.15):
+    """Cached float32 silence written between chunks in the output WAV."""
+    return np.zeros(int(seconds * sr), dtype=np.float32)
+
+
+def _float_to_pcm16(wav):
+    """Convert a float waveform to int16 PCM in one vectorized pass.
+
+    With numexpr installed the scale+clip is a single fused loop over the
+    samples (NumPy is memory-bound here, so one pass instead of two is the
+    win); otherwise it scales and clips in-place on a single float32
+    temporary instead of allocating a fresh array per operation.
+    """
+    if numexpr is not None:
+        # Constants go through local_dict as float32: bare literals in the
+        # expression are doubles and would promote the whole evaluation to
+        # float64, doubling memory traffic on the intermediate.
+        scaled = numexpr.evaluate(
+            "where(x > hi, big, where(x < lo, small, x * big))",
+            local_dict={"x": wav,
+                        "hi": np.float32(1.0), "lo": np.float32(-1.0),
+                        "big": np.float32(32767.0),
+                        "small": np.float32(-32768.0)})
+        return scaled.astype(np.int16, copy=False)
+    scaled = np.multiply(wav, 32767.0, dtype=np.float32)
+    np.clip(scaled, -32768.0, 32767.0, out=scaled)
+    return scaled.astype(np.int16)
+
+# Preset-voice references resolved once per process: voice codes never
+# change at runtime, yet get_preset_voice + the .cpu().numpy() conversion
+# used to run on every job. Keyed by codec too, since the code tensors
+# belong to whichever codec decoded them.
+_preset_voice_cache = {}
+
+# Uploaded-reference encodings keyed by (codec, blake2b of the file
+# bytes) — the codes are host ndarrays, valid for any backbone:
+# users iterating on prompts against the same voice upload identical audio
+# repeatedly, and each miss costs a full codec forward pass. LRU-bounded so
+# a stream of one-off uploads cannot grow it without limit.
+_ref_encode_cache = OrderedDict()
+_REF_ENCODE_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=128)
+def _split_cached(text, max_chars=256):
+    """split_text_into_chunks memoized by text: regenerating the same text
+    with a different voice/temperature (the common tweak loop) skips the
+    regex segmentation pass. Returns a tuple so the result is hashable and
+    safely shared between jobs."""
+    return tuple(split_text_into_chunks(text, max_chars=max_chars))
+
+
+@lru_cache(maxsize=8)
+def _infer_supports_cancel(model_cls):
+    """True when the model class's infer() accepts a cancel_check callable.
+
+    FastVieNeuTTS and RemoteVieNeuTTS don't take one, so the signature is
+    inspected once per class rather than guessed per job.
+    """
+    try:
+        return "cancel_check" in inspect.signature(model_cls.infer).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _prepare_ref_codes(ref_codes):
+    """Convert reference codes to a host ndarray once, up front.
+
+    infer() only ever iterates the codes to build the prompt string
+    (_apply_chat_template), so a device tensor is never consumed as a
+    tensor — keeping one around would cost a device sync per code element
+    per chunk when the prompt is formatted. One .cpu().numpy() per
+    encode/preset-load is the cheap form, whatever device the backbone
+    runs on.
+    """
     import torch
 
+    if not isinstance(ref_codes, torch.Tensor):
+        return ref_codes
+    return ref_codes.detach().cpu().numpy()
+
+
+def _preset_voice(voice_id, model=None, codec_choice=None):
+    """Return (ref_codes, ref_text) for a preset voice, cached.
+
+    Keyed by codec: the code sequence belongs to whichever codec produced
+    it. Callers holding a submit-time snapshot pass it in; the defaults
+    cover call sites that run against whatever is currently loaded.
+    """
+    if model is None:
+        model = tts
+    if codec_choice is None:
+        codec_choice = current_codec
+    key = (codec_choice, voice_id)
+    cached = _preset_voice_cache.get(key)
+    if cached is not None:
+        return cached
+    voice_data = model.get_preset_voice(voice_id)
+    ref_codes = _prepare_ref_codes(voice_data["codes"])
+    _preset_voice_cache[key] = (ref_codes, voice_data["text"])
+    return _preset_voice_cache[key]
+
+
+def _run_synthesis(job_id, text, voice_id, ref_audio_path, ref_text, temperature, username="anonymous", ref_cache_key=None, synth_cache_key=None, ref_codes=None, tts=None, codec_choice=None):
+    # tts deliberately shadows the global: the handler snapshots the model
+    # at submit, so a /api/load_model swap while this job queued cannot
+    # make it synthesize (and publish under synth_cache_key) with a model
+    # that no longer matches the key.
+    global active_job_id
+
     job = jobs[job_id]
-    job["status"] = "processing"
+    with active_lock:
+        active_job_id = job_id
+    _set_job(job_id, status="processing")
+
+    writer = None
+    audio_path = None
+    postproc = []
+
+    def _discard_partial():
+        """Close and remove a partially written WAV (cancel/error paths)."""
+        if writer is not None:
+            try:
+                writer.close()
+                os.unlink(audio_path)
+            except OSError:
+                pass
 
     try:
-        # Resolve reference
-        ref_codes = None
+        # Resolve reference. Cached codes arrive pre-resolved from the
+        # submit path (see synthesize) so an LRU eviction while the job
+        # queued cannot drop the reference.
         ref_text_resolved = None
 
-        if ref_audio_path:
-            job["progress"] = "Encoding reference audio..."
-            ref_codes = tts.encode_reference(ref_audio_path)
-            if isinstance(ref_codes, torch.Tensor):
-                ref_codes = ref_codes.cpu().numpy()
+        if ref_codes is not None:
             ref_text_resolved = ref_text or ""
-            # Clean up temp file
+        elif ref_audio_path:
+            _set_job(job_id, progress="Encoding reference audio...")
             try:
-                os.unlink(ref_audio_path)
-            except OSError:
-                pass
+                ref_codes = _prepare_ref_codes(tts.encode_reference(ref_audio_path))
+            finally:
+                # The temp upload must not outlive the encode attempt —
+                # a failing encode would otherwise leak it in /tmp.
+                try:
+                    os.unlink(ref_audio_path)
+                except OSError:
+                    pass
+            ref_text_resolved = ref_text or ""
+            if ref_cache_key is not None:
+                _ref_encode_cache[ref_cache_key] = ref_codes
+                while len(_ref_encode_cache) > _REF_ENCODE_CACHE_SIZE:
+                    _ref_encode_cache.popitem(last=False)
         elif voice_id:
-            job["progress"] = "Loading preset voice..."
-            voice_data = tts.get_preset_voice(voice_id)
-            ref_codes = voice_data["codes"]
-            if isinstance(ref_codes, torch.Tensor):
-                ref_codes = ref_codes.cpu().numpy()
-            ref_text_resolved = voice_data["text"]
+            _set_job(job_id, progress="Loading preset voice...")
+            ref_codes, ref_text_resolved = _preset_voice(voice_id, tts,
+                                                         codec_choice)
 
         # Split text into chunks and synthesize one by one
-        from vieneu_utils.core_utils import split_text_into_chunks, join_audio_chunks
-        import soundfile as sf
-
-        chunks = split_text_into_chunks(text, max_chars=256)
+        chunks = _split_cached(text, 256)
         total = len(chunks)
-        job["chunks_total"] = total
-        all_wavs = []
+        _set_job(job_id, chunks_total=total)
         chunk_times = []
         job_start = time.time()
 
+        # The final WAV is written incrementally as chunks finish: the old
+        # all_wavs list + join_audio_chunks pass held every chunk plus the
+        # full concatenation in RAM at once. Peak extra memory is now one
+        # chunk regardless of text length, and the final join pass is gone.
+        user_dir = OUTPUTS_DIR / username
+        user_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        audio_path = str(user_dir / f"{timestamp}_{job_id[:8]}.wav")
+        writer = sf.SoundFile(audio_path, mode="w",
+                              samplerate=tts.sample_rate, channels=1,
+                              subtype="PCM_16")
+        written_samples = 0
+
         logging.info("Job %s started — %d chars, %d chunk(s)", job_id[:8], len(text), total)
 
-        for i, chunk in enumerate(chunks, 1):
-            if job.get("cancelled"):
-                job["status"] = "error"
-                job["error"] = "Cancelled"
-                try:
-                    job["pcm_queue"].put(None, timeout=1)
-                except Exception:
-                    pass
-                elapsed = time.time() - job_start
-                logging.info("Job %s cancelled after %.1fs (%d/%d chunks)", job_id[:8], elapsed, i - 1, total)
-                return
-            job["progress"] = f"Generating chunk {i}/{total}..."
+        def _emit_chunk(i, chunk_wav):
+            """Write a finished chunk to the WAV and push its PCM to stream
+            listeners.
+
+            A byte-cast memoryview shares the int16 array's buffer (and
+            keeps it alive), so no .tobytes() copy is made per chunk.
+            """
+            nonlocal written_samples
+            writer.write(chunk_wav)
+            written_samples += len(chunk_wav)
+            _set_job(job_id, chunks_done=i)
+            pcm_int16 = _float_to_pcm16(chunk_wav)
+            _publish_pcm(job, pcm_int16.data.cast("B"))
+            # Add silence between chunks (0.15s)
+            if i < total:
+                silence = _silence_f32(tts.sample_rate)
+                writer.write(silence)
+                written_samples += len(silence)
+                _publish_pcm(job, _silence_pcm16(tts.sample_rate))
+
+        # Postprocessing of chunk N runs on _postproc_executor while the
+        # synthesis thread begins chunk N+1; the futures are drained before
+        # anything that assumes all chunks have been recorded.
+        def _flush_postproc():
+            for fut in postproc:
+                fut.result()
+            postproc.clear()
+
+        # LMDeploy-backed models (FastVieNeuTTS) can synthesize every chunk
+        # in one batched call. The standard backbones are single-sequence
+        # autoregressive, so they keep the per-chunk loop, which also gives
+        # streaming progress and cancellation points between chunks.
+        if total > 1 and hasattr(tts, "infer_batch"):
+            _set_job(job_id, progress=f"Generating {total} chunks (batched)...")
             t0 = time.time()
-            chunk_wav = tts.infer(
-                text=chunk,
+            batch_wavs = tts.infer_batch(
+                chunks,
                 ref_codes=ref_codes,
                 ref_text=ref_text_resolved,
                 temperature=temperature,
             )
-            chunk_time = time.time() - t0
-            chunk_times.append(chunk_time)
-            if chunk_wav is not None and len(chunk_wav) > 0:
-                chunk_dur = len(chunk_wav) / tts.sample_rate
-                logging.info("  Chunk %d/%d: %d chars → %.1fs audio in %.1fs (RTF %.2f, %.1f chars/s)",
-                             i, total, len(chunk), chunk_dur, chunk_time,
-                             chunk_time / chunk_dur if chunk_dur > 0 else 0,
-                             len(chunk) / chunk_dur if chunk_dur > 0 else 0)
-                all_wavs.append(chunk_wav)
-                job["chunks_done"] = i
-                # Push raw PCM (int16 LE) to stream queue
-                pcm_int16 = (chunk_wav * 32767).clip(-32768, 32767).astype(np.int16)
-                try:
-                    job["pcm_queue"].put(pcm_int16.tobytes(), timeout=10)
-                except queue.Full:
-                    pass
-                # Add silence between chunks (0.15s)
-                if i < total:
-                    silence = np.zeros(int(0.15 * tts.sample_rate), dtype=np.int16)
-                    try:
-                        job["pcm_queue"].put(silence.tobytes(), timeout=5)
-                    except queue.Full:
-                        pass
-
+            chunk_times.append(time.time() - t0)
+            for i, chunk_wav in enumerate(batch_wavs, 1):
+                if chunk_wav is not None and len(chunk_wav) > 0:
+                    _emit_chunk(i, chunk_wav)
+        else:
+            for i, chunk in enumerate(chunks, 1):
+                if job.cancelled:
+                    _flush_postproc()
+                    _discard_partial()
+                    _set_job(job_id, status="error", error="Cancelled")
+                    _publish_pcm(job, None)
+                    elapsed = time.time() - job_start
+                    logging.info("Job %s cancelled after %.1fs (%d/%d chunks)", job_id[:8], elapsed, i - 1, total)
+                    return
+                _set_job(job_id, progress=f"Generating chunk {i}/{total}...")
+                t0 = time.time()
+                if _infer_supports_cancel(type(tts)):
+                    # infer() keeps the one-shot decode path (identical
+                    # audio to an uncancelled run) while polling between
+                    # generated tokens on GGUF backbones, so cancellation
+                    # lands within a token instead of waiting out a long
+                    # chunk. Returns None when the check fires.
+                    chunk_wav = tts.infer(
+                        text=chunk,
+                        ref_codes=ref_codes,
+                        ref_text=ref_text_resolved,
+                        temperature=temperature,
+                        cancel_check=lambda: job.cancelled,
+                    )
+                    if job.cancelled:
+                        _flush_postproc()
+                        _discard_partial()
+                        _set_job(job_id, status="error", error="Cancelled")
+                        _publish_pcm(job, None)
+                        elapsed = time.time() - job_start
+                        logging.info("Job %s cancelled mid-chunk after %.1fs (%d/%d chunks)",
+                                     job_id[:8], elapsed, i - 1, total)
+                        return
+                else:
+                    chunk_wav = tts.infer(
+                        text=chunk,
+                        ref_codes=ref_codes,
+                        ref_text=ref_text_resolved,
+                        temperature=temperature,
+                    )
+                chunk_time = time.time() - t0
+                chunk_times.append(chunk_time)
+                if chunk_wav is not None and len(chunk_wav) > 0:
+                    chunk_dur = len(chunk_wav) / tts.sample_rate
+                    logging.info("  Chunk %d/%d: %d chars → %.1fs audio in %.1fs (RTF %.2f, %.1f chars/s)",
+                                 i, total, len(chunk), chunk_dur, chunk_time,
+                                 chunk_time / chunk_dur if chunk_dur > 0 else 0,
+                                 len(chunk) / chunk_dur if chunk_dur > 0 else 0)
+                    postproc.append(_postproc_executor.submit(_emit_chunk, i, chunk_wav))
+
+        _flush_postproc()
         # Signal end of PCM stream
-        try:
-            job["pcm_queue"].put(None, timeout=5)
-        except queue.Full:
-            pass
+        _publish_pcm(job, None)
 
-        if not all_wavs:
-            job["status"] = "error"
-            job["error"] = "No audio generated"
+        if written_samples == 0:
+            _set_job(job_id, status="error", error="No audio generated")
+            _discard_partial()
             return
 
-        job["progress"] = f"Joining {total} chunks..."
-        audio = join_audio_chunks(all_wavs, sr=tts.sample_rate, silence_p=0.15)
-
-        # Save joined final WAV to user's output directory
-        user_dir = OUTPUTS_DIR / username
-        user_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        audio_path = str(user_dir / f"{timestamp}_{job_id[:8]}.wav")
-        sf.write(audio_path, audio, tts.sample_rate)
+        writer.close()
+        st = os.stat(audio_path)
+        job.etag = hashlib.md5(
+            f"{audio_path}{st.st_mtime}{st.st_size}".encode()).hexdigest()
+        # Keep small WAVs in memory for the job's lifetime so refresh /
+        # re-download never re-reads the disk (the TTL sweeper frees them).
+        if st.st_size < _AUDIO_CACHE_MAX_BYTES:
+            job.audio_bytes = Path(audio_path).read_bytes()
+            if synth_cache_key is not None:
+                _mem_cache_put(synth_cache_key, job.audio_bytes)
+        # Publish into the content-addressed cache so an identical request
+        # skips synthesis entirely.
+        if synth_cache_key is not None:
+            cache_path = CACHE_DIR / f"{synth_cache_key}.wav"
+            if not cache_path.exists():
+                try:
+                    os.link(audio_path, cache_path)
+                except OSError:
+                    try:
+                        shutil.copyfile(audio_path, cache_path)
+                    except OSError:
+                        pass
 
-        job["audio_path"] = audio_path
-        job["status"] = "done"
-        job["progress"] = f"Done — {total} chunks"
+        _set_job(job_id, audio_path=audio_path, status="done",
+                 progress=f"Done — {total} chunks")
+        _encode_opus_async(job_id, audio_path, synth_cache_key)
 
         # Log summary
         total_time = time.time() - job_start
-        audio_dur = len(audio) / tts.sample_rate
+        audio_dur = written_samples / tts.sample_rate
         avg_chunk = sum(chunk_times) / len(chunk_times) if chunk_times else 0
         logging.info("Job %s done — %d chars, %.1fs audio, %d chunks, %.1fs total, %.1fs avg/chunk, RTF %.2f, %.1f chars/s",
                      job_id[:8], len(text), audio_dur, total, total_time, avg_chunk,
@@ -528,57 +1666,179 @@ def _run_synthesis(job_id, text, voice_id, ref_audio_path, ref_text, temperature
                      len(text) / audio_dur if audio_dur > 0 else 0)
 
     except Exception as e:
-        job["status"] = "error"
-        job["error"] = str(e)
+        _set_job(job_id, status="error", error=str(e))
         # Signal end of stream on error too
-        try:
-            job["pcm_queue"].put(None, timeout=1)
-        except Exception:
-            pass
+        _publish_pcm(job, None)
+        # Drain pending chunk postprocessing before discarding, or a
+        # still-queued _emit_chunk could race writer.write() against the
+        # close/unlink below. The job already failed, so swallow whatever
+        # those futures raise.
+        for fut in postproc:
+            try:
+                fut.result()
+            except Exception:
+                pass
+        _discard_partial()
     finally:
+        # The end-of-stream sentinel must reach listeners no matter how the
+        # job ended, or stream generators would spin on their poll timeout
+        # forever; re-publishing after an explicit sentinel is harmless.
+        if not job.pcm_done:
+            _publish_pcm(job, None)
+        if synth_cache_key is not None:
+            with _inflight_lock:
+                if _inflight.get(synth_cache_key) == job_id:
+                    del _inflight[synth_cache_key]
+        if tts is not None:
+            _release_model(tts)
         with active_lock:
             if active_job_id == job_id:
                 active_job_id = None
 
 
+# index.html has no Jinja placeholders, so it is read and compressed once
+# at import instead of going through the template engine per request.
+# Brotli (max quality — it's one-shot) beats gzip by ~15-20% on this HTML.
+_INDEX_HTML = (Path(__file__).parent / "templates" / "index.html").read_bytes()
+_INDEX_GZ = gzip.compress(_INDEX_HTML, compresslevel=6)
+_INDEX_BR = brotli.compress(_INDEX_HTML, quality=11) if brotli else None
+_INDEX_ETAG = hashlib.md5(_INDEX_GZ).hexdigest()
+
+
 @app.get("/")
 def index():
-    return render_template("index.html")
+    if request.if_none_match.contains(_INDEX_ETAG):
+        return "", 304
+    accept = request.headers.get("Accept-Encoding", "")
+    if _INDEX_BR is not None and "br" in accept:
+        resp = Response(_INDEX_BR, mimetype="text/html")
+        resp.headers["Content-Encoding"] = "br"
+    elif "gzip" in accept:
+        resp = Response(_INDEX_GZ, mimetype="text/html")
+        resp.headers["Content-Encoding"] = "gzip"
+    else:
+        resp = Response(_INDEX_HTML, mimetype="text/html")
+    resp.set_etag(_INDEX_ETAG)
+    resp.headers["Cache-Control"] = "public, max-age=3600"
+    resp.headers["Vary"] = "Accept-Encoding"
+    return resp
 
 
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
+def _warmup_tts(tts_obj):
+    """Run one short dummy inference to pay first-call costs up front.
+
+    The first real request otherwise absorbs tokenizer init, CUDA kernel
+    compilation / ONNX session warm-up and allocator growth, which can add
+    seconds to its latency.
+    """
+    try:
+        voice = tts_obj.get_preset_voice(DEFAULT_VOICE)
+        t0 = time.time()
+        tts_obj.infer(text="Xin chào.", ref_codes=voice["codes"],
+                      ref_text=voice["text"])
+        logging.info("Warm-up inference done in %.1fs", time.time() - t0)
+    except Exception as e:
+        logging.warning("Warm-up inference skipped: %s", e)
+
+
+def _render_voice_preview(voice_id, remaining=()):
+    """Synthesize the short preview phrase for one preset voice, then
+    queue the next.
+
+    Only one preview task ever sits on the synthesis executor: the next
+    voice is submitted from the tail of this one, so a user job (or a
+    register_voice encode) arriving mid-batch queues behind at most the
+    preview currently rendering — never the whole batch.
+    """
+    path = _preview_path(voice_id)
+    if not path.exists():
+        model = tts
+        _acquire_model(model)
+        try:
+            ref_codes, ref_text = _preset_voice(voice_id, model)
+            wav = model.infer(text=PREVIEW_TEXT, ref_codes=ref_codes,
+                              ref_text=ref_text)
+            sf.write(str(path), wav, model.sample_rate)
+        except Exception as e:
+            logging.warning("Preview for voice %s failed: %s", voice_id, e)
+        finally:
+            _release_model(model)
+    if remaining:
+        _synth_executor.submit(_render_voice_preview, remaining[0],
+                               remaining[1:])
+
+
+def _queue_voice_previews():
+    """Kick off chained preview rendering for preset voices lacking one.
+
+    Previews persist on disk across restarts, so after the first startup
+    this is a no-op.
+    """
+    if not env_bool("VIENEU_VOICE_PREVIEWS", True):
+        return
+    try:
+        voices = tts.list_preset_voices()
+    except Exception:
+        return
+    missing = [vid for _desc, vid in voices
+               if not _preview_path(vid).exists()]
+    if missing:
+        _synth_executor.submit(_render_voice_preview, missing[0],
+                               tuple(missing[1:]))
+
+
 def preload_model():
-    """Load default model at startup so it's ready when the UI opens."""
+    """Load the default model in the background so the port opens
+    immediately; /api/health flips to ready when the weights are in."""
     global tts, model_loaded, current_backbone, current_codec
-    import torch
-    from vieneu import VieNeuTTS
 
     backbone_cfg = BACKBONE_CONFIGS[DEFAULT_BACKBONE]
     codec_cfg = CODEC_CONFIGS[DEFAULT_CODEC]
-
-    backbone_device = "cpu"
-    if "gguf" not in backbone_cfg["repo"].lower():
-        if sys.platform == "darwin":
-            backbone_device = "mps" if torch.backends.mps.is_available() else "cpu"
-        else:
-            backbone_device = "cuda" if torch.cuda.is_available() else "cpu"
-
-    codec_device = "cpu"  # ONNX codec always CPU
+    backbone_device, codec_device = _select_devices(DEFAULT_BACKBONE, DEFAULT_CODEC)
 
     print(f"Preloading: {backbone_cfg['repo']} ({backbone_device}) + {codec_cfg['repo']} ({codec_device})")
-    tts = VieNeuTTS(
-        backbone_repo=backbone_cfg["repo"],
-        backbone_device=backbone_device,
-        codec_repo=codec_cfg["repo"],
-        codec_device=codec_device,
-    )
+    try:
+        tts = _get_or_load_model(DEFAULT_BACKBONE, DEFAULT_CODEC)
+    except Exception as e:
+        logging.error("Model preload failed: %s", e)
+        return
     model_loaded = True
     current_backbone = DEFAULT_BACKBONE
     current_codec = DEFAULT_CODEC
+    model_ready.set()
     print("Model preloaded and ready.")
+    _queue_voice_previews()
+
+
+_bg_threads_started = False
+_bg_threads_lock = threading.Lock()
+
+
+def _start_background_threads():
+    """Start the per-process daemons: model preload and the job sweeper.
+
+    These must run in the process that serves requests. Under the embedded
+    gunicorn runner the arbiter forks a worker, and threads started in the
+    master do not survive the fork — preloading there would load the
+    weights into a process that never answers a request while the worker
+    sat unready, and the sweeper would never reap the worker's jobs dict.
+    Idempotent so the post_fork hook and the Werkzeug fallback can both
+    call it.
+    """
+    global _bg_threads_started
+    with _bg_threads_lock:
+        if _bg_threads_started:
+            return
+        _bg_threads_started = True
+    threading.Thread(target=preload_model, daemon=True,
+                     name="model-preload").start()
+    threading.Thread(target=_sweep_jobs, daemon=True,
+                     name="job-sweeper").start()
+
 
 SERVICES = [
     "https://api.ipify.org",
@@ -596,6 +1856,52 @@ def _detect_local_ip():
     return "127.0.0.1"
 
 
+def _run_gunicorn(port):
+    """Serve under gunicorn with threaded workers if available.
+
+    A single worker keeps the model loaded once; threads handle concurrent
+    status/audio requests. sendfile=True lets WAV downloads go through the
+    kernel sendfile() path instead of userspace read/write copies.
+    Returns False when gunicorn is not installed (e.g. Windows).
+    """
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        return False
+
+    flask_app = app
+
+    class _Server(BaseApplication):
+        def load_config(self):
+            self.cfg.set("bind", f"0.0.0.0:{port}")
+            self.cfg.set("worker_class", "gthread")
+            # Pre-forked workers do not fit this app: job state (progress,
+            # PCM replay buffers, SSE listeners, caches) lives in-process,
+            # so a second worker would 404 half the status/audio requests.
+            # One worker with a thread pool gives the concurrency the I/O
+            # endpoints need; inference parallelism is VIENEU_SYNTH_WORKERS.
+            self.cfg.set("workers", 1)
+            self.cfg.set("threads",
+                         int(os.environ.get("VIENEU_WEB_THREADS", "16")))
+            self.cfg.set("sendfile", True)
+            self.cfg.set("timeout", 0)
+            # Preload and the job sweeper start here, in the worker — see
+            # _start_background_threads for why the master is the wrong
+            # process for them.
+            self.cfg.set("post_fork",
+                         lambda server, worker: _start_background_threads())
+            # Hold connections open so the UI's bursty JSON requests reuse
+            # one TCP/TLS session instead of reconnecting per call
+            self.cfg.set("keepalive", 30)
+
+        def load(self):
+            return flask_app
+
+    logging.info("Serving with gunicorn (gthread, sendfile enabled)")
+    _Server().run()
+    return True
+
+
 if __name__ == "__main__":
     PORT = int(os.environ.get("PORT", 5000))
     # DIRECT_HOST can be set to force a specific IP/hostname for direct audio URLs.
@@ -608,5 +1914,13 @@ if __name__ == "__main__":
     def direct_url():
         return jsonify({"url": DIRECT_BASE})
 
-    preload_model()
-    app.run(host="0.0.0.0", port=PORT, debug=False)
+    # The model preloads in the background of whichever process serves
+    # requests (gunicorn starts it from post_fork): the HTTP port opens
+    # immediately and the UI polls /api/health for readiness instead of
+    # staring at a dead port for the tens of seconds the weights take.
+    if os.environ.get("FLASK_DEV") == "1" or not _run_gunicorn(PORT):
+        _start_background_threads()
+        # Werkzeug speaks HTTP/1.0 (no keep-alive) unless told otherwise
+        from werkzeug.serving import WSGIRequestHandler
+        WSGIRequestHandler.protocol_version = "HTTP/1.1"
+        app.run(host="0.0.0.0", port=PORT, debug=False, threaded=True)
@@ -24,6 +24,15 @@ async function fetchDirectUrl() {
 }
 function getDirectUrl() { return _directUrl || getBaseUrl(); }
 
+// Prefer the ~32 kbps Opus rendition (10x smaller than the WAV) when the
+// server has finished encoding it and the browser can decode it.
+const CAN_PLAY_OPUS = !!document.createElement('audio')
+  .canPlayType('audio/ogg; codecs=opus');
+function bestAudioUrl(data) {
+  const path = (CAN_PLAY_OPUS && data.audio_url_opus) ? data.audio_url_opus : data.audio_url;
+  return `${getDirectUrl()}${path}`;
+}
+
 // Persist server URL on change (extension only)
 if (IS_EXTENSION) {
   const inp = document.getElementById('inp-server-url');
@@ -74,10 +83,31 @@ function getJobMap() {
 document.addEventListener('input', saveState);
 document.addEventListener('change', saveState);
 
+// Play the pre-rendered preview when a preset voice is picked
+const previewPlayer = new Audio();
+document.getElementById('sel-voice').addEventListener('change', (e) => {
+  const opt = e.target.selectedOptions[0];
+  const url = opt && opt.dataset.preview;
+  if (!url) return;
+  previewPlayer.src = `${getDirectUrl()}${url}`;
+  previewPlayer.play().catch(() => {});
+});
+
 // ---- Rows ----
 let rowCounter = 0;
-const pollTimers = {};       // rowId -> intervalId
+const polledJobs = {};       // rowId -> jobId (fallback polling only)
+const eventSources = {};     // rowId -> EventSource (SSE status stream)
 const streamAborts = {};     // rowId -> AbortController (for PCM stream fetch)
+let pollTicker = null;       // single shared interval for all polled rows
+
+function stopWatch(rowId) {
+  if (eventSources[rowId]) { eventSources[rowId].close(); delete eventSources[rowId]; }
+  delete polledJobs[rowId];
+  if (pollTicker && Object.keys(polledJobs).length === 0) {
+    clearInterval(pollTicker);
+    pollTicker = null;
+  }
+}
 
 function addRow(text, rowId) {
   if (!rowId) rowId = 'r' + (++rowCounter);
@@ -123,7 +153,7 @@ function stopStream(rowId) {
 function stopRow(rowId) {
   stopStream(rowId);
   cancelFromQueue(rowId);
-  if (pollTimers[rowId]) { clearInterval(pollTimers[rowId]); delete pollTimers[rowId]; }
+  stopWatch(rowId);
   // Cancel server-side generation
   const jobMap = getJobMap();
   const jobId = jobMap[rowId];
@@ -145,7 +175,7 @@ function clearRow(rowId) {
     // Remove this row entirely
     const row = document.querySelector(`.text-row[data-id="${rowId}"]`);
     if (row) row.remove();
-    if (pollTimers[rowId]) { clearInterval(pollTimers[rowId]); delete pollTimers[rowId]; }
+    stopWatch(rowId);
     const jm = getJobMap(); delete jm[rowId]; saveJobMap(jm);
   } else {
     // Last row — just clear content
@@ -160,7 +190,8 @@ function clearRow(rowId) {
 
 function stopAll() {
   const jobMap = getJobMap();
-  for (const id of Object.keys(pollTimers)) { clearInterval(pollTimers[id]); delete pollTimers[id]; }
+  for (const id of Object.keys(polledJobs)) stopWatch(id);
+  for (const id of Object.keys(eventSources)) stopWatch(id);
   for (const id of Object.keys(streamAborts)) stopStream(id);
   genQueue.length = 0;
   stopGenQueuePoller();
@@ -182,8 +213,9 @@ function stopAll() {
 }
 
 function clearAll() {
-  // Stop all poll timers, streams, queue, and playback queue
-  for (const id of Object.keys(pollTimers)) { clearInterval(pollTimers[id]); delete pollTimers[id]; }
+  // Stop all status watchers, streams, queue, and playback queue
+  for (const id of Object.keys(polledJobs)) stopWatch(id);
+  for (const id of Object.keys(eventSources)) stopWatch(id);
   for (const id of Object.keys(streamAborts)) stopStream(id);
   genQueue.length = 0;
   stopGenQueuePoller();
@@ -734,7 +766,7 @@ async function init() {
     const selV = document.getElementById('sel-voice');
     if (voices.length > 0) {
       selV.innerHTML = voices.map(v =>
-        `<option value="${esc(v.id)}"${v.id === pickVoice ? ' selected' : ''}>${esc(v.description)} (${esc(v.id)})</option>`
+        `<option value="${esc(v.id)}" data-preview="${esc(v.preview_url || '')}"${v.id === pickVoice ? ' selected' : ''}>${esc(v.description)} (${esc(v.id)})</option>`
       ).join('');
     }
     setStatus(document.getElementById('model-status'), 'success', 'Model preloaded and ready.');
@@ -782,11 +814,11 @@ async function init() {
         const data = await r.json();
         if (data.status === 'done') {
           setStatus(el.st, 'success', data.progress || 'Done!');
-          el.player.src = `${getDirectUrl()}${data.audio_url}`;
+          el.player.src = bestAudioUrl(data);
           el.player.style.display = 'block';
         } else if (data.status === 'processing' || data.status === 'pending') {
           setStatus(el.st, 'info', 'Resuming...');
-          pollRow(rowId, jobId);
+          watchRow(rowId, jobId);
         } else if (data.status === 'error') {
           setStatus(el.st, 'error', 'Error: ' + (data.error || 'Unknown'));
         }
@@ -838,27 +870,39 @@ async function loadModel() {
   btn.disabled = true;
   setStatus(st, 'info', 'Loading model...');
 
+  const backbone = document.getElementById('sel-backbone').value;
+  const codec = document.getElementById('sel-codec').value;
+
   try {
-    const resp = await fetch(`${getBaseUrl()}/api/load_model`, {
-      method: 'POST',
-      headers: {'Content-Type': 'application/json'},
-      body: JSON.stringify({
-        backbone: document.getElementById('sel-backbone').value,
-        codec: document.getElementById('sel-codec').value,
-      }),
-    });
-    const data = await resp.json();
-    if (!resp.ok) throw new Error(data.error || 'Failed');
+    // Skip the load request entirely if the server already has this
+    // selection ready (e.g. the background preload finished).
+    let loaded = false;
+    try {
+      const h = await fetch(`${getBaseUrl()}/api/health`).then(r => r.json());
+      loaded = h.ready && h.backbone === backbone && h.codec === codec;
+    } catch { /* fall through to load_model */ }
+
+    if (loaded) {
+      setStatus(st, 'success', `Model ready: ${backbone} + ${codec}`);
+    } else {
+      const resp = await fetch(`${getBaseUrl()}/api/load_model`, {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({ backbone, codec }),
+      });
+      const data = await resp.json();
+      if (!resp.ok) throw new Error(data.error || 'Failed');
 
-    setStatus(st, 'success',
-      `Model loaded: ${data.backbone} (${data.backbone_device}) + ${data.codec} (${data.codec_device})`);
+      setStatus(st, 'success',
+        `Model loaded: ${data.backbone} (${data.backbone_device}) + ${data.codec} (${data.codec_device})`);
+    }
 
     const voices = await fetch(`${getBaseUrl()}/api/voices`).then(r => r.json());
     const selV = document.getElementById('sel-voice');
     const savedVoice = getSavedState().voice || DEFAULT_VOICE;
     if (voices.length > 0) {
       selV.innerHTML = voices.map(v =>
-        `<option value="${esc(v.id)}"${v.id === savedVoice ? ' selected' : ''}>${esc(v.description)} (${esc(v.id)})</option>`
+        `<option value="${esc(v.id)}" data-preview="${esc(v.preview_url || '')}"${v.id === savedVoice ? ' selected' : ''}>${esc(v.description)} (${esc(v.id)})</option>`
       ).join('');
     } else {
       selV.innerHTML = '<option value="">No preset voices available</option>';
@@ -880,11 +924,35 @@ function cancelFromQueue(rowId) {
   if (idx !== -1) genQueue.splice(idx, 1);
 }
 
+// Upload the reference audio once per file and reuse the returned id:
+// without this, "Generate All" re-uploads and re-encodes the same voice
+// for every row. The id is remembered on the file input until the
+// selected file changes.
+async function getVoiceRefId(fileInput) {
+  const file = fileInput.files[0];
+  const sig = `${file.name}:${file.size}:${file.lastModified}`;
+  if (fileInput.dataset.voiceSig === sig && fileInput.dataset.voiceRefId) {
+    return fileInput.dataset.voiceRefId;
+  }
+  try {
+    const fd = new FormData();
+    fd.append('ref_audio', file);
+    const r = await fetch(`${getBaseUrl()}/api/register_voice`, { method: 'POST', body: fd });
+    if (!r.ok) return null;
+    const d = await r.json();
+    if (!d.voice_ref_id) return null;
+    fileInput.dataset.voiceSig = sig;
+    fileInput.dataset.voiceRefId = d.voice_ref_id;
+    return d.voice_ref_id;
+  } catch {
+    return null;
+  }
+}
+
 async function submitSynthesize(rowId, text) {
   const presetActive = document.getElementById('panel-preset').classList.contains('active');
-  let resp;
   if (presetActive) {
-    resp = await fetch(`${getBaseUrl()}/api/synthesize`, {
+    return fetch(`${getBaseUrl()}/api/synthesize`, {
       method: 'POST',
       headers: {'Content-Type': 'application/json'},
       body: JSON.stringify({
@@ -894,71 +962,73 @@ async function submitSynthesize(rowId, text) {
         username: getUsername(),
       }),
     });
-  } else {
-    const fd = new FormData();
-    fd.append('text', text);
-    fd.append('temperature', document.getElementById('inp-temp').value);
-    fd.append('ref_text', document.getElementById('inp-ref-text').value);
-    fd.append('username', getUsername());
-    const fileInput = document.getElementById('inp-ref-audio');
-    if (fileInput.files.length > 0) fd.append('ref_audio', fileInput.files[0]);
-    resp = await fetch(`${getBaseUrl()}/api/synthesize`, { method: 'POST', body: fd });
   }
-  return resp;
-}
 
-// Try to submit the next row in the queue
-async function processGenQueue() {
-  if (genQueue.length === 0) {
-    stopGenQueuePoller();
-    updateGenAllBtn();
-    return;
-  }
-
-  // Single check: is the server busy?
-  try {
-    const r = await fetch(`${getDirectUrl()}/api/busy`);
-    const info = await r.json();
-    if (info.busy) {
-      // Update status for all queued rows
-      const waitMsg = info.reason || 'waiting for server...';
-      genQueue.forEach((rid, i) => {
-        const el = getRowEl(rid);
-        if (el) setStatus(el.st, 'info', `Queued #${i + 1} — ${waitMsg}`);
+  const fileInput = document.getElementById('inp-ref-audio');
+  if (fileInput.files.length > 0) {
+    const voiceRefId = await getVoiceRefId(fileInput);
+    if (voiceRefId) {
+      return fetch(`${getBaseUrl()}/api/synthesize`, {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({
+          text: text,
+          voice_ref_id: voiceRefId,
+          ref_text: document.getElementById('inp-ref-text').value,
+          temperature: parseFloat(document.getElementById('inp-temp').value) || 1.0,
+          username: getUsername(),
+        }),
       });
-      return; // will retry on next tick
     }
-  } catch (e) {
-    return; // network error, retry next tick
   }
 
-  // Server is free — submit the first row in queue
-  const rowId = genQueue.shift();
-  const el = getRowEl(rowId);
-  if (!el) { processGenQueue(); return; }
+  // Fallback: registration unavailable — upload with the request as before
+  const fd = new FormData();
+  fd.append('text', text);
+  fd.append('temperature', document.getElementById('inp-temp').value);
+  fd.append('ref_text', document.getElementById('inp-ref-text').value);
+  fd.append('username', getUsername());
+  if (fileInput.files.length > 0) fd.append('ref_audio', fileInput.files[0]);
+  return fetch(`${getBaseUrl()}/api/synthesize`, { method: 'POST', body: fd });
+}
 
-  const text = el.textarea.value.trim();
-  if (!text) { el.btn.disabled = false; processGenQueue(); return; }
+// Submit every queued row immediately: the server accepts all requests and
+// runs them FIFO on its own worker queue, so there is no busy pre-check or
+// 503 retry dance anymore. The poller only remains as a retry backstop for
+// network failures.
+async function processGenQueue() {
+  while (genQueue.length > 0) {
+    const rowId = genQueue.shift();
+    const el = getRowEl(rowId);
+    if (!el) continue;
 
-  try {
-    const resp = await submitSynthesize(rowId, text);
-    const data = await resp.json();
-    if (resp.status === 503 && data.busy) {
-      // Race condition: put it back at the front
+    const text = el.textarea.value.trim();
+    if (!text) { el.btn.disabled = false; continue; }
+
+    let resp;
+    try {
+      resp = await submitSynthesize(rowId, text);
+    } catch (e) {
+      // Network error — put it back and retry on the next tick
       genQueue.unshift(rowId);
-      setStatus(el.st, 'info', 'Queued #1 — waiting for server...');
+      setStatus(el.st, 'info', 'Waiting for server...');
       return;
     }
-    if (!resp.ok) throw new Error(data.error || 'Failed');
+    try {
+      const data = await resp.json();
+      if (!resp.ok) throw new Error(data.error || 'Failed');
 
-    const jobMap = getJobMap(); jobMap[rowId] = data.job_id; saveJobMap(jobMap);
-    setStatus(el.st, 'info', 'Processing...');
-    startPcmStream(rowId, data.job_id);
-    pollRow(rowId, data.job_id);
-  } catch (e) {
-    setStatus(el.st, 'error', 'Error: ' + e.message);
-    el.btn.disabled = false;
+      const jobMap = getJobMap(); jobMap[rowId] = data.job_id; saveJobMap(jobMap);
+      setStatus(el.st, 'info', 'Processing...');
+      startPcmStream(rowId, data.job_id);
+      watchRow(rowId, data.job_id);
+    } catch (e) {
+      setStatus(el.st, 'error', 'Error: ' + e.message);
+      el.btn.disabled = false;
+    }
   }
+  stopGenQueuePoller();
+  updateGenAllBtn();
 }
 
 function startGenQueuePoller() {
@@ -1027,50 +1097,100 @@ function updateGenAllBtn() {
   document.getElementById('btn-gen-all').disabled = allBusy;
 }
 
+// Shared handler for a status payload coming from SSE or polling.
+function handleStatusUpdate(rowId, jobId, data) {
+  const el = getRowEl(rowId);
+  if (!el) { stopWatch(rowId); return; }
+  if (data.status === 'processing' || data.status === 'pending') {
+    setStatus(el.st, 'info', data.progress || 'Processing...');
+  } else if (data.status === 'done') {
+    stopWatch(rowId);
+    setStatus(el.st, 'success', data.progress || 'Done!');
+    el.btn.disabled = false;
+    // Store server URL; onended handler will switch to it
+    el.row.dataset.serverAudio = bestAudioUrl(data);
+    // If no MSE stream active, set the server audio now
+    if (el.player.paused && !(el.player.src && el.player.src.startsWith('blob:'))) {
+      el.player.src = bestAudioUrl(data);
+      el.player.style.display = 'block';
+    }
+    updateGenAllBtn();
+  } else if (data.status === 'error') {
+    stopWatch(rowId);
+    stopStream(rowId);
+    setStatus(el.st, 'error', 'Error: ' + (data.error || 'Unknown'));
+    el.btn.disabled = false; updateGenAllBtn();
+  }
+}
+
+// Watch job progress over a single SSE connection; falls back to
+// 1 Hz polling when EventSource is unavailable or the stream breaks.
+function watchRow(rowId, jobId) {
+  const el = getRowEl(rowId);
+  if (!el) return;
+  el.btn.disabled = true;
+  stopWatch(rowId);
+
+  if (!window.EventSource) { pollRow(rowId, jobId); return; }
+
+  const es = new EventSource(`${getDirectUrl()}/api/events/${jobId}`);
+  eventSources[rowId] = es;
+  es.onmessage = (e) => {
+    let data;
+    try { data = JSON.parse(e.data); } catch { return; }
+    handleStatusUpdate(rowId, jobId, data);
+  };
+  es.onerror = () => {
+    // Stream broken (proxy buffering, server restart...) — poll instead
+    if (eventSources[rowId] !== es) return;
+    stopWatch(rowId);
+    pollRow(rowId, jobId);
+  };
+}
+
+// All polled rows share one 1 Hz ticker hitting /api/status_batch, so
+// "Generate All" with N rows costs one HTTP request per tick instead of N.
 function pollRow(rowId, jobId) {
   const el = getRowEl(rowId);
   if (!el) return;
   el.btn.disabled = true;
 
-  if (pollTimers[rowId]) clearInterval(pollTimers[rowId]);
-  pollTimers[rowId] = setInterval(async () => {
+  polledJobs[rowId] = jobId;
+  if (!pollTicker) pollTicker = setInterval(pollTick, 1000);
+}
+
+async function pollTick() {
+  const entries = Object.entries(polledJobs);
+  if (entries.length === 0) return;
+  let statuses;
+  try {
+    const r = await fetch(`${getDirectUrl()}/api/status_batch`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ job_ids: entries.map(([, jobId]) => jobId) }),
+    });
+    statuses = await r.json();
+  } catch (e) {
+    for (const [rowId] of entries) {
+      stopWatch(rowId);
+      const el = getRowEl(rowId);
+      if (el) { setStatus(el.st, 'error', 'Polling error: ' + e.message); el.btn.disabled = false; }
+    }
+    return;
+  }
+  for (const [rowId, jobId] of entries) {
     const el = getRowEl(rowId);
-    if (!el) { clearInterval(pollTimers[rowId]); delete pollTimers[rowId]; return; }
-    try {
-      const r = await fetch(`${getDirectUrl()}/api/status/${jobId}`);
-      if (r.status === 404) {
-        clearInterval(pollTimers[rowId]); delete pollTimers[rowId];
-        const jm = getJobMap(); delete jm[rowId]; saveJobMap(jm);
-        setStatus(el.st, 'error', 'Job expired (server may have restarted)');
-        el.btn.disabled = false; updateGenAllBtn(); return;
-      }
-      const data = await r.json();
-      if (data.status === 'processing' || data.status === 'pending') {
-        setStatus(el.st, 'info', data.progress || 'Processing...');
-      } else if (data.status === 'done') {
-        clearInterval(pollTimers[rowId]); delete pollTimers[rowId];
-        setStatus(el.st, 'success', data.progress || 'Done!');
-        el.btn.disabled = false;
-        // Store server URL; onended handler will switch to it
-        el.row.dataset.serverAudio = `${getDirectUrl()}${data.audio_url}`;
-        // If no MSE stream active, set server WAV now
-        if (el.player.paused && !(el.player.src && el.player.src.startsWith('blob:'))) {
-          el.player.src = `${getDirectUrl()}${data.audio_url}`;
-          el.player.style.display = 'block';
-        }
-        updateGenAllBtn();
-      } else if (data.status === 'error') {
-        clearInterval(pollTimers[rowId]); delete pollTimers[rowId];
-        stopStream(rowId);
-        setStatus(el.st, 'error', 'Error: ' + (data.error || 'Unknown'));
-        el.btn.disabled = false; updateGenAllBtn();
-      }
-    } catch (e) {
-      clearInterval(pollTimers[rowId]); delete pollTimers[rowId];
-      setStatus(el.st, 'error', 'Polling error: ' + e.message);
-      el.btn.disabled = false;
+    if (!el) { stopWatch(rowId); continue; }
+    const data = statuses[jobId];
+    if (!data) {
+      stopWatch(rowId);
+      const jm = getJobMap(); delete jm[rowId]; saveJobMap(jm);
+      setStatus(el.st, 'error', 'Job expired (server may have restarted)');
+      el.btn.disabled = false; updateGenAllBtn();
+      continue;
     }
-  }, 1000);
+    handleStatusUpdate(rowId, jobId, data);
+  }
 }
 
 // ---- Chrome extension: receive text from content script via chrome.storage ----
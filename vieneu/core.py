@@ -465,7 +465,7 @@ class VieNeuTTS:
             ref_codes = self.codec.encode_code(audio_or_path=wav_tensor).squeeze(0).squeeze(0)
         return ref_codes
 
-    def infer(self, text: str, ref_audio: str | Path = None, ref_codes: np.ndarray | torch.Tensor = None, ref_text: str = None, max_chars: int = 256, silence_p: float = 0.15, crossfade_p: float = 0.0, voice: dict = None, temperature: float = 1.0, top_k: int = 50) -> np.ndarray:
+    def infer(self, text: str, ref_audio: str | Path = None, ref_codes: np.ndarray | torch.Tensor = None, ref_text: str = None, max_chars: int = 256, silence_p: float = 0.15, crossfade_p: float = 0.0, voice: dict = None, temperature: float = 1.0, top_k: int = 50, cancel_check=None) -> np.ndarray:
         """
         Perform inference to generate speech from text using the TTS model and reference audio.
         Automatically splits long text into chunks.
@@ -481,8 +481,12 @@ class VieNeuTTS:
             voice (dict): Optional dictionary containing 'codes' and 'text' (overrides ref_codes/ref_text).
             temperature (float): Sampling temperature (default 1.0).
             top_k (int): Top-k sampling (default 50).
+            cancel_check (callable): Optional zero-arg callable polled during
+                generation; when it returns True, inference aborts and None
+                is returned. GGUF backbones poll it between generated tokens,
+                the torch backbone between text chunks.
         Returns:
-            np.ndarray: Generated speech waveform.
+            np.ndarray: Generated speech waveform, or None if cancelled.
         """
         if voice is not None:
             ref_codes = voice.get('codes', ref_codes)
@@ -513,9 +517,13 @@ class VieNeuTTS:
 
         all_wavs = []
         for chunk in chunks:
+            if cancel_check is not None and cancel_check():
+                return None
             # Generate tokens
             if self._is_quantized_model:
-                output_str = self._infer_ggml(ref_codes, ref_text, chunk, temperature, top_k)
+                output_str = self._infer_ggml(ref_codes, ref_text, chunk, temperature, top_k, cancel_check)
+                if output_str is None:
+                    return None
             else:
                 prompt_ids = self._apply_chat_template(ref_codes, ref_text, chunk)
                 output_str = self._infer_torch(prompt_ids, temperature, top_k)
@@ -652,7 +660,7 @@ class VieNeuTTS:
         )
         return output_str
 
-    def _infer_ggml(self, ref_codes: list[int], ref_text: str, input_text: str, temperature: float = 1.0, top_k: int = 50) -> str:
+    def _infer_ggml(self, ref_codes: list[int], ref_text: str, input_text: str, temperature: float = 1.0, top_k: int = 50, cancel_check=None) -> str:
         ref_text = phonemize_with_dict(ref_text)
         input_text = phonemize_with_dict(input_text)
 
@@ -661,6 +669,22 @@ class VieNeuTTS:
             f"user: Convert the text to speech:<|TEXT_PROMPT_START|>{ref_text} {input_text}"
             f"<|TEXT_PROMPT_END|>\nassistant:<|SPEECH_GENERATION_START|>{codes_str}"
         )
+        if cancel_check is not None:
+            # Token-streamed generation so cancellation can abort between
+            # tokens; the joined text is identical to the one-shot output.
+            pieces = []
+            for item in self.backbone(
+                prompt,
+                max_tokens=self.max_context,
+                temperature=temperature,
+                top_k=top_k,
+                stop=["<|SPEECH_GENERATION_END|>"],
+                stream=True,
+            ):
+                pieces.append(item["choices"][0]["text"])
+                if cancel_check():
+                    return None
+            return "".join(pieces)
         output = self.backbone(
             prompt,
             max_tokens=self.max_context,
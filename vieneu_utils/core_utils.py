@@ -3,44 +3,51 @@ import os
 from typing import List
 import numpy as np
 
+def _join_with_crossfade(chunks: list[np.ndarray], crossfade_samples: int) -> np.ndarray:
+    """Crossfade consecutive chunks (overlap depends on the running length,
+    so this path keeps the incremental join)."""
+    final_wav = chunks[0]
+    for i in range(1, len(chunks)):
+        next_chunk = chunks[i]
+        overlap = min(len(final_wav), len(next_chunk), crossfade_samples)
+        if overlap > 0:
+            fade_out = np.linspace(1.0, 0.0, overlap, dtype=np.float32)
+            fade_in = np.linspace(0.0, 1.0, overlap, dtype=np.float32)
+
+            blended = (final_wav[-overlap:] * fade_out + next_chunk[:overlap] * fade_in)
+            final_wav = np.concatenate([
+                final_wav[:-overlap],
+                blended,
+                next_chunk[overlap:]
+            ])
+        else:
+            final_wav = np.concatenate([final_wav, next_chunk])
+    return final_wav
+
 def join_audio_chunks(chunks: list[np.ndarray], sr: int, silence_p: float = 0.0, crossfade_p: float = 0.0) -> np.ndarray:
     """Join audio chunks with optional silence padding and crossfading."""
     if not chunks:
         return np.array([], dtype=np.float32)
     if len(chunks) == 1:
         return chunks[0]
-    
+
     silence_samples = int(sr * silence_p)
     crossfade_samples = int(sr * crossfade_p)
-    
-    final_wav = chunks[0]
-    
-    for i in range(1, len(chunks)):
-        next_chunk = chunks[i]
-        
-        if silence_samples > 0:
-            # 1. Add silence between chunks
-            silence = np.zeros(silence_samples, dtype=np.float32)
-            final_wav = np.concatenate([final_wav, silence, next_chunk])
-        elif crossfade_samples > 0:
-            # 2. Crossfade between chunks
-            overlap = min(len(final_wav), len(next_chunk), crossfade_samples)
-            if overlap > 0:
-                fade_out = np.linspace(1.0, 0.0, overlap, dtype=np.float32)
-                fade_in = np.linspace(0.0, 1.0, overlap, dtype=np.float32)
-                
-                blended = (final_wav[-overlap:] * fade_out + next_chunk[:overlap] * fade_in)
-                final_wav = np.concatenate([
-                    final_wav[:-overlap],
-                    blended,
-                    next_chunk[overlap:]
-                ])
-            else:
-                final_wav = np.concatenate([final_wav, next_chunk])
-        else:
-            # 3. Simple concatenation
-            final_wav = np.concatenate([final_wav, next_chunk])
-            
+
+    if silence_samples <= 0 and crossfade_samples > 0:
+        return _join_with_crossfade(chunks, crossfade_samples)
+
+    # Silence padding / simple concatenation: the output length is known up
+    # front, so allocate it once and copy each chunk into place. The old
+    # np.concatenate-per-chunk loop recopied all accumulated audio on every
+    # iteration (quadratic in total length). np.zeros gives the silence
+    # gaps for free.
+    total = sum(len(c) for c in chunks) + silence_samples * (len(chunks) - 1)
+    final_wav = np.zeros(total, dtype=np.float32)
+    pos = 0
+    for chunk in chunks:
+        final_wav[pos:pos + len(chunk)] = chunk
+        pos += len(chunk) + silence_samples
     return final_wav
 
 def split_text_into_chunks(text: str, max_chars: int = 256) -> List[str]: